@@ -14,7 +14,7 @@ from .progress_bar import ProgressBar
 from .rainbow_filter import RainbowFilter
 from .render_buffer import RenderBuffer
 from .rgb_matrix_display_target import RGBMatrixDisplayTarget
-from .scene import Scene
+from .scene import Scene, enable_debug_logging
 from .scrollbar import Scrollbar
 from .table_component import TableComponent
 from .terminal_display_target import TerminalDisplayTarget
@@ -23,6 +23,7 @@ from .text_component import TextComponent
 __all__ = [
     "Orchestrator",
     "Scene",
+    "enable_debug_logging",
     "Component",
     "RenderBuffer",
     "cache_with_dict",
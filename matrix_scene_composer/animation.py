@@ -123,8 +123,17 @@ class Animation:
         self.easing = easing
         self.completed = False
 
+    @property
+    def easing(self) -> str:
+        """Easing function name."""
+        return self._easing
+
+    @easing.setter
+    def easing(self, easing: str):
         if easing not in EASING_FUNCTIONS:
             raise ValueError(f"Unknown easing function: {easing}. Available: {list(EASING_FUNCTIONS.keys())}")
+        self._easing = easing
+        self._easing_fn = EASING_FUNCTIONS[easing]
 
     def update(self, state: dict, elapsed: float) -> bool:
         """
@@ -156,8 +165,7 @@ class Animation:
 
     def _apply_easing(self, t: float) -> float:
         """Apply easing function to linear progress."""
-        easing_fn = EASING_FUNCTIONS[self.easing]
-        return easing_fn(t)
+        return self._easing_fn(t)
 
     def _apply(self, state: dict, progress: float):
         """
@@ -249,6 +257,8 @@ class Animate(Animation):
         # Cache resolved start/end values (computed on first update)
         self._resolved_from: Optional[Dict[str, Any]] = None
         self._resolved_to: Optional[Dict[str, Any]] = None
+        # Per-frame interpolation plan: (param, from_val, to_val - from_val, round_to_int)
+        self._lerp_plan: List[tuple] = []
 
     def reset(self):
         """Reset animation to initial state, clearing cached resolved parameters."""
@@ -309,22 +319,24 @@ class Animate(Animation):
             self._resolved_from[param] = from_val
             self._resolved_to[param] = to_val
 
+        self._lerp_plan = [
+            (param, from_val, self._resolved_to[param] - from_val, param in self._int_params)
+            for param, from_val in self._resolved_from.items()
+        ]
+
     def _apply(self, state: dict, progress: float):
         """Apply parameter interpolation at given progress."""
         # Resolve parameters on first apply
         if self._resolved_from is None:
             self._resolve_params(state)
 
-        # Interpolate each parameter
-        for param in self._resolved_from:
-            from_val = self._resolved_from[param]
-            to_val = self._resolved_to[param]
-
+        # Interpolate each parameter (deltas and int flags resolved up front)
+        for param, from_val, delta, round_to_int in self._lerp_plan:
             # Linear interpolation
-            value = from_val + (to_val - from_val) * progress
+            value = from_val + delta * progress
 
             # Round to integer if this parameter was declared with _int variant
-            if param in self._int_params:
+            if round_to_int:
                 value = int(value)
 
             # Apply to state
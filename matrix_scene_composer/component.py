@@ -17,7 +17,13 @@ def _make_hashable(obj):
     elif isinstance(obj, list):
         return tuple(_make_hashable(item) for item in obj)
     elif isinstance(obj, tuple):
-        return tuple(_make_hashable(item) for item in obj)
+        # Already-hashable tuples (e.g. pre-frozen state) are returned as-is -
+        # hashing walks them in C instead of rebuilding them in Python
+        try:
+            hash(obj)
+            return obj
+        except TypeError:
+            return tuple(_make_hashable(item) for item in obj)
     else:
         return obj
 
@@ -82,6 +88,12 @@ class Component(ABC):
     # Class variable for debug rendering
     DEBUG_RENDER = False
 
+    # Opt-in for components whose render() has no side effects: a Scene may then
+    # skip rendering them while they are offscreen or fully transparent. Off by
+    # default because composites such as a nested Scene advance their animations
+    # and _rendered_at when rendered.
+    render_offscreen_skippable = False
+
     def __init__(self):
         """Initialize component."""
         self._rendered_at = 0.0  # Time when render output last changed
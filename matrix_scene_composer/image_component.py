@@ -16,6 +16,9 @@ class ImageComponent(Component):
     Loads common image formats (PNG, JPG, GIF, etc.) and renders them to the display.
     """
 
+    # render() has no side effects, so a Scene may skip it while offscreen
+    render_offscreen_skippable = True
+
     def __init__(self, image_path: str | Path):
         """
         Initialize ImageComponent.
@@ -94,16 +94,7 @@ class Orchestrator:
         self.current_scene._time = self.time
 
         # Check for phase transitions (same logic as Scene.start_async)
-        scene = self.current_scene
-        scene_time = scene._time
-
-        if scene._current_phase == 'entrance' and scene._check_phase_complete(scene_time):
-            if scene.idle_animations:
-                scene.set_animation_phase('idle')
-            else:
-                scene.set_animation_phase(None)
-        elif scene._current_phase == 'idle' and scene._check_phase_complete(scene_time):
-            scene.set_animation_phase('idle')
+        self.current_scene._advance_phase(self.current_scene._time)
 
         # Render current scene
         buffer = self.current_scene.render(self.time)
@@ -17,6 +17,9 @@ class ProgressBar(Component):
     - Border support
     """
 
+    # render() has no side effects, so a Scene may skip it while offscreen
+    render_offscreen_skippable = True
+
     def __init__(
         self,
         width: int,
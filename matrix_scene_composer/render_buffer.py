@@ -16,6 +16,37 @@ class RenderBuffer:
         # Default to fully opaque
         self.data[:, :, 3] = 255
 
+    @classmethod
+    def transparent(cls, width: int, height: int) -> 'RenderBuffer':
+        """Create a fully transparent buffer without the opaque-fill and clear passes."""
+        buffer = cls.__new__(cls)
+        buffer.width = width
+        buffer.height = height
+        buffer.data = np.zeros((height, width, 4), dtype=np.uint8)
+        return buffer
+
+    @classmethod
+    def filled(
+        cls, width: int, height: int, color: Tuple[int, int, int] | Tuple[int, int, int, int]
+    ) -> 'RenderBuffer':
+        """Create a buffer filled with color (r, g, b) or (r, g, b, a) in a single pass."""
+        if len(color) == 3:
+            color = (*color, 255)  # Opaque
+        buffer = cls.__new__(cls)
+        buffer.width = width
+        buffer.height = height
+        buffer.data = np.empty((height, width, 4), dtype=np.uint8)
+        buffer.data[:] = color
+        return buffer
+
+    @classmethod
+    def from_array(cls, data: np.ndarray) -> 'RenderBuffer':
+        """Wrap an existing (height, width, 4) uint8 array without copying it."""
+        buffer = cls.__new__(cls)
+        buffer.height, buffer.width = data.shape[:2]
+        buffer.data = data
+        return buffer
+
     def set_pixel(self, x: int, y: int, color: Tuple[int, int, int] | Tuple[int, int, int, int]):
         """Set pixel at (x, y) to color (r, g, b) or (r, g, b, a)."""
         if 0 <= x < self.width and 0 <= y < self.height:
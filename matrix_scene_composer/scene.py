@@ -1,28 +1,107 @@
 """Scene - Composite component container with positioning, layering, and animations."""
 
 import asyncio
+import bisect
+import os
 import time
 import logging
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, Tuple, Optional, List, Callable
-from .component import Component, cache_with_dict, DEBUG
+from .animation import Loop, slide_in_all, slide_out_all, fade_in_all, fade_out_all
+from .component import Component, cache_with_dict, _make_hashable, DEBUG
 from .render_buffer import RenderBuffer
 
-# Setup logging to file
-logging.basicConfig(
-    filename="/tmp/animation_demo.log",
-    level=logging.DEBUG,
-    format="%(asctime)s.%(msecs)03d - %(message)s",
-    datefmt="%H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
+# Shortest frame-pacing sleep worth a timer; shorter waits just yield to the loop
+_MIN_SLEEP_NS = 2_000_000
+
+# Animation helpers accepted by name in Scene.apply_all
+_APPLY_ALL_MAP = {
+    "slide_in": slide_in_all,
+    "slide_out": slide_out_all,
+    "fade_in": fade_in_all,
+    "fade_out": fade_out_all,
+}
+
+
+# File handler installed by enable_debug_logging, if any
+_debug_handler: Optional[logging.FileHandler] = None
+
+
+def enable_debug_logging(path: str = "/tmp/animation_demo.log"):
+    """
+    Log scene and animation phase activity at DEBUG level to a file.
+
+    Calling it again for the same file keeps the existing handler; a different
+    path replaces it, so records are never written twice.
+    """
+    global _debug_handler
+    if _debug_handler is None or _debug_handler.baseFilename != os.path.abspath(path):
+        if _debug_handler is not None:
+            logger.removeHandler(_debug_handler)
+            _debug_handler.close()
+        _debug_handler = logging.FileHandler(path)
+        _debug_handler.setFormatter(
+            logging.Formatter("%(asctime)s.%(msecs)03d - %(message)s", datefmt="%H:%M:%S")
+        )
+        logger.addHandler(_debug_handler)
+    logger.setLevel(logging.DEBUG)
+
+
+# Scene.debug_state output blocks
+_DEBUG_HEADER_TEMPLATE = (
+    "{rule}\n"
+    "SCENE DEBUG STATE (time={time:.3f}s)\n"
+    "{rule}\n"
+    "Scene dimensions: {width}x{height}\n"
+    "Current phase: {phase}\n"
+    "Active animations: {num_anims}\n"
+    "Focused child: {focused}"
+)
+_DEBUG_CHILD_TEMPLATE = (
+    "Component: '{id}'\n"
+    "  Type: {type}\n"
+    "  Dimensions: {width}x{height}\n"
+    "  Position: x={x}, y={y}\n"
+    "  Visibility: {visibility}\n"
+    "  Opacity: {opacity}\n"
+    "  Z-index: {z_index}\n"
+    "  Focused: {focused}\n"
+    "  Focusable: {focusable}\n"
+    "  Active animations: {anims}"
+)
+_DEBUG_ANIM_TEMPLATE = (
+    "    - {type}: progress={progress:.2%}, "
+    "elapsed={elapsed:.3f}s/{duration:.3f}s, "
+    "completed={completed}"
+)
+
 
 class ComponentInstance:
     """Component instance in a scene with state (x, y, opacity, z_index)."""
 
+    __slots__ = (
+        "component",
+        "state",
+        "_child_state",
+        "_child_state_key",
+        "_z_index",
+        "_render_state",
+    )
+
     def __init__(self, component: Component, **state):
         self.component = component
         self.state = state  # Dict: {x, y, opacity, z_index, ...}
+        # Last component state seen by the scene and its hashable form
+        self._child_state = None
+        self._child_state_key = None
+        # z_index the scene's render order was last sorted with
+        self._z_index = state.get("z_index", 0)
+        # Last (x, y, opacity, z_index, child_state) tuple handed to the scene state
+        self._render_state = None
 
 
 class Scene(Component):
@@ -65,7 +144,16 @@ class Scene(Component):
             raise ValueError("Must provide either 'size' or both 'width' and 'height'")
 
         self.children: Dict[str, ComponentInstance] = {}
+        # Child IDs in render order (ascending z_index), re-sorted only when z changes
+        self._z_order: List[str] = []
+        self._z_order_dirty = False
+        # Last compute_state children tuple, rebuilt only when a child changes
+        self._children_state: Optional[Tuple] = None
         self.canvas = RenderBuffer(self._width, self._height)
+        # Last buffer the single-child fast path checked for opacity, and the answer
+        # (rendered buffers are not modified once returned, so identity is enough)
+        self._opacity_checked_buffer: Optional[RenderBuffer] = None
+        self._opacity_checked = False
 
         # Focus management
         self._focused_child: Optional[str] = None
@@ -76,19 +164,36 @@ class Scene(Component):
         self.idle_animations = idle_animations or []
         self.exit_animations = exit_animations or []
 
-        # Custom animation phases - user-defined
-        self._custom_phases: Dict[str, List[Tuple[float, "Animation"]]] = {}
-
-        # Current active animations
+        # Phase name -> animations; custom phases are merged in on registration
+        self._phase_table: Dict[str, List[Tuple[float, "Animation"]]] = {
+            "entrance": self.entrance_animations,
+            "idle": self.idle_animations,
+            "exit": self.exit_animations,
+        }
+        # Phase name -> time the last animation of the phase ends (relative to phase start)
+        self._phase_max_end: Dict[str, float] = {
+            name: self._compute_max_end(anims) for name, anims in self._phase_table.items()
+        }
+
+        # Current active animations, kept sorted by start time
         self.current_animations: List[Tuple[float, "Animation"]] = []
+        self._anims_by_target: Dict[str, List[Tuple[float, "Animation"]]] = {}
+        # Leading current_animations entries known to be complete (see _check_phase_complete)
+        self._completed_prefix = 0
         self._scene_start_time: Optional[float] = None
         self._current_phase: Optional[str] = None
+        # Events set when a phase completes (created on demand by await_phase_complete)
+        self._phase_done_events: Dict[Optional[str], asyncio.Event] = {}
 
         # Standalone mode (without orchestrator)
         self._display_callback: Optional[Callable[[RenderBuffer], None]] = None
         self._running = False
         self._time = 0.0
         self._fps = 30
+        # Opt-in: render on a worker thread instead of the event loop (see
+        # set_threaded_render)
+        self._threaded_render = False
+        self._render_executor: Optional[ThreadPoolExecutor] = None
 
     @property
     def width(self) -> int:
@@ -125,6 +230,7 @@ class Scene(Component):
             state["y"] = position[1]
 
         self.children[child_id] = ComponentInstance(component, **state)
+        self._sort_z_order()
 
         # Trigger mount lifecycle
         component._trigger_mount()
@@ -145,6 +251,8 @@ class Scene(Component):
             component._trigger_unmount()
 
             del self.children[child_id]
+            self._z_order.remove(child_id)
+            self._children_state = None
 
             # Update focus if we removed the focused child
             if self._focused_child == child_id:
@@ -156,6 +264,18 @@ class Scene(Component):
             if child_id in self._focusable_children:
                 self._focusable_children.remove(child_id)
 
+    def set_child_z_index(self, child_id: str, z_index: int):
+        """Set a child's z_index and update the render order."""
+        self.children[child_id].state["z_index"] = z_index
+        self.children[child_id]._z_index = z_index
+        self._sort_z_order()
+
+    def _sort_z_order(self):
+        """Rebuild the render order from the children's z_index values."""
+        self._z_order = sorted(self.children, key=lambda k: self.children[k]._z_index)
+        self._z_order_dirty = False
+        self._children_state = None
+
     def reset(self):
         """Reset scene to initial state for re-entry."""
         self._time = 0.0
@@ -164,11 +284,7 @@ class Scene(Component):
         self.clear_animations()
 
         # Reset all animations
-        for anim_list in [self.entrance_animations, self.idle_animations, self.exit_animations]:
-            for _, anim in anim_list:
-                anim.reset()
-
-        for phase_anims in self._custom_phases.values():
+        for phase_anims in self._phase_table.values():
             for _, anim in phase_anims:
                 anim.reset()
 
@@ -233,17 +349,23 @@ class Scene(Component):
 
     def add_animation(self, animation: "Animation", start_time: float = 0.0):
         """Add animation to current animations."""
-        self.current_animations.append((start_time, animation))
+        # Ties keep insertion order, so start times never compare animations
+        bisect.insort(self.current_animations, (start_time, animation), key=itemgetter(0))
+        self._anims_by_target.setdefault(animation.target, []).append((start_time, animation))
+        self._completed_prefix = 0
 
     def clear_animations(self):
         """Clear all current animations."""
         self.current_animations.clear()
+        self._anims_by_target.clear()
+        self._completed_prefix = 0
 
     def compute_state(self, time: float) -> dict:
         """
         Compute scene state: child positions/opacities + render timestamps.
 
-        Scene state includes:
+        Scene state includes, per child in render order, a
+        (child_id, (x, y, opacity, z_index, child_state)) pair:
         - Child state (position, opacity, z_index) with animations applied
         - Child render timestamps (for cache invalidation)
 
@@ -251,27 +373,78 @@ class Scene(Component):
         - Time (would invalidate cache every frame)
         - Component internal state (respects encapsulation)
         """
-        scene_time = self._time if hasattr(self, "_time") else 0.0
+        scene_time = self._time
 
-        child_states = {}
+        changed = False
 
         for child_id, instance in self.children.items():
             # Apply animations using the Animation's own update() method
-            for start_time, anim in self.current_animations:
-                if anim.target == child_id:
-                    elapsed = max(0.0, scene_time - start_time)
-                    anim.update(instance.state, elapsed)
+            for start_time, anim in self._anims_by_target.get(child_id, ()):
+                elapsed = max(0.0, scene_time - start_time)
+                anim.update(instance.state, elapsed)
+
+            # Build render tuple (x, y, opacity, z_index, child component state) -
+            # only the keys _render_cached reads, plus child state for cache invalidation
+            child_state = instance.state
+            z_index = child_state.get("z_index", 0)
+            if z_index != instance._z_index:
+                # Changed by an animation or direct state edit - re-sort before next render
+                instance._z_index = z_index
+                self._z_order_dirty = True
 
-            # Build state dict for rendering (includes child component state for cache invalidation)
-            state = instance.state.copy()
             child_component_state = instance.component.compute_state(time)
-            from .component import _make_hashable
 
-            state["_child_state"] = _make_hashable(child_component_state)
+            # Only rebuild the hashable form when the component state changed
+            if child_component_state != instance._child_state:
+                instance._child_state = child_component_state
+                instance._child_state_key = _make_hashable(child_component_state)
+
+            # Reuse last frame's tuple when nothing changed, so state comparisons
+            # against the previous frame short-circuit on identity
+            x = child_state.get("x", 0)
+            y = child_state.get("y", 0)
+            opacity = child_state.get("opacity", 1.0)
+            render_state = instance._render_state
+            if (
+                render_state is None
+                or render_state[0] != x
+                or render_state[1] != y
+                or render_state[2] != opacity
+                or render_state[3] != z_index
+                or render_state[4] is not instance._child_state_key
+            ):
+                instance._render_state = (x, y, opacity, z_index, instance._child_state_key)
+                changed = True
+
+        if self._z_order_dirty:
+            self._sort_z_order()
+
+        # Children as a frozen (child_id, render tuple) sequence in render order.
+        # Already hashable, so the cache key needs no conversion, and reused as-is
+        # when no child changed.
+        if changed or self._children_state is None:
+            children = self.children
+            self._children_state = tuple(
+                (child_id, children[child_id]._render_state) for child_id in self._z_order
+            )
+
+        return {"children": self._children_state}
 
-            child_states[child_id] = state
+    def _is_offscreen(self, x: int, y: int, width: int, height: int) -> bool:
+        """Check if a width x height rect at (x, y) lies entirely outside the canvas."""
+        return x + width <= 0 or y + height <= 0 or x >= self._width or y >= self._height
 
-        return {"children": child_states}
+    def _is_opaque(self, buffer: RenderBuffer) -> bool:
+        """Check whether every pixel of buffer is fully opaque, remembering the last answer."""
+        if buffer is not self._opacity_checked_buffer:
+            alpha = buffer.data[:, :, 3]
+            # A transparent corner settles the common transparent-background case
+            # without scanning the whole alpha plane
+            self._opacity_checked = bool(
+                alpha.size and alpha[0, 0] == 255 and (alpha == 255).all()
+            )
+            self._opacity_checked_buffer = buffer
+        return self._opacity_checked
 
     @cache_with_dict(maxsize=32)
     def _render_cached(self, state: dict, time: float) -> RenderBuffer:
@@ -286,26 +459,51 @@ class Scene(Component):
         - All child state unchanged
         - All child _rendered_at timestamps unchanged
         """
-        canvas = RenderBuffer(self._width, self._height)
-        canvas.clear()
+        children_state = state["children"]
+
+        # Single full-frame opaque child: compositing it onto a blank canvas would
+        # reproduce its buffer exactly, so hand that buffer back directly. A
+        # non-opaque one is composited below from the buffer rendered here.
+        prerendered = None
+        if len(children_state) == 1:
+            child_id, (x, y, opacity, _, _) = children_state[0]
+            component = self.children[child_id].component
+            if (
+                opacity == 1.0
+                and int(x) == 0
+                and int(y) == 0
+                and component.width == self._width
+                and component.height == self._height
+            ):
+                prerendered = component.render(time)
+                if self._is_opaque(prerendered):
+                    return prerendered
 
-        # Sort by z_index
-        sorted_children = sorted(
-            state["children"].items(), key=lambda item: item[1].get("z_index", 0)
-        )
+        # Cached canvases are handed out and kept by the cache, so each miss needs
+        # its own buffer - but a zeroed allocation is all a transparent canvas needs
+        canvas = RenderBuffer.transparent(self._width, self._height)
+
+        # Composite children in z_index order (compute_state emits them sorted)
+        for child_id, (x, y, opacity, _, _) in children_state:
+            component = self.children[child_id].component
 
-        # Composite children
-        for child_id, child_state in sorted_children:
-            instance = self.children[child_id]
+            x = int(x)
+            y = int(y)
+
+            # Children that would contribute no pixels - fully transparent (e.g. mid
+            # fade-in/out) or entirely outside the canvas (slide-in/out) - are not
+            # composited. Only components that opted in skip render() as well;
+            # others (e.g. a nested Scene) still render for its side effects.
+            if opacity <= 0 or self._is_offscreen(x, y, component.width, component.height):
+                if not component.render_offscreen_skippable:
+                    component.render(time)
+                continue
 
             # Child renders itself (uses its own cache)
-            buffer = instance.component.render(time)
+            buffer = prerendered if prerendered is not None else component.render(time)
 
             # Composite with child's state
-            x = int(child_state.get("x", 0))
-            y = int(child_state.get("y", 0))
-
-            canvas.blit(buffer, (x, y), child_state.get("opacity", 1.0))
+            canvas.blit(buffer, (x, y), opacity)
 
         return canvas
 
@@ -313,21 +511,27 @@ class Scene(Component):
         self, phase_name: str, animations: List[Tuple[float, "Animation"]]
     ):
         """Register a custom animation phase."""
-        self._custom_phases[phase_name] = animations
+        self._phase_table[phase_name] = animations
+        self._phase_max_end[phase_name] = self._compute_max_end(animations)
         logger.info(
-            f"Registered custom animation phase '{phase_name}' with {len(animations)} animation(s)"
+            "Registered custom animation phase '%s' with %d animation(s)", phase_name, len(animations)
         )
 
+    @staticmethod
+    def _compute_max_end(animations: List[Tuple[float, "Animation"]]) -> float:
+        """Time at which the last animation in a phase ends (0.0 if empty)."""
+        return max((start_time + anim.duration for start_time, anim in animations), default=0.0)
+
     def set_animation_phase(self, phase: Optional[str]):
         """Set the current animation phase."""
-        current_scene_time = self._time if hasattr(self, "_time") else 0.0
+        current_scene_time = self._time
 
         if phase is None:
-            logger.debug(f"set_animation_phase(None) - clearing all animations")
+            logger.debug("set_animation_phase(None) - clearing all animations")
             self._current_phase = None
             self.clear_animations()
         else:
-            logger.debug(f"set_animation_phase('{phase}') at scene_time={current_scene_time:.3f}")
+            logger.debug("set_animation_phase('%s') at scene_time=%.3f", phase, current_scene_time)
             self._start_phase(phase, current_scene_time)
 
     def _start_phase(self, phase: str, current_scene_time: float = 0.0):
@@ -335,99 +539,136 @@ class Scene(Component):
         self._current_phase = phase
         self.clear_animations()
 
-        animations = None
-
-        if phase == "entrance":
-            animations = self.entrance_animations
-        elif phase == "idle":
-            animations = self.idle_animations
-        elif phase == "exit":
-            animations = self.exit_animations
-        elif phase in self._custom_phases:
-            animations = self._custom_phases[phase]
-        else:
-            logger.warning(f"Unknown animation phase: '{phase}'")
+        animations = self._phase_table.get(phase)
+        if animations is None:
+            logger.warning("Unknown animation phase: '%s'", phase)
             return
 
         for start_time, anim in animations:
             anim.reset()
             self.add_animation(anim, current_scene_time + start_time)
 
-            if anim.target in self.children:
-                anim.update(self.children[anim.target].state, 0.0)
-                logger.debug(f"  Applied frame 0 of animation to '{anim.target}'")
+            instance = self.children.get(anim.target)
+            if instance is not None:
+                anim.update(instance.state, 0.0)
+                logger.debug("  Applied frame 0 of animation to '%s'", anim.target)
 
-        logger.debug(f"  Loaded {len(animations)} animations for phase '{phase}'")
+        logger.debug("  Loaded %d animations for phase '%s'", len(animations), phase)
 
     def _check_phase_complete(self, scene_time: float) -> bool:
         """Check if all animations in current phase are complete."""
         if not self.current_animations:
             return True
 
-        for start_time, anim in self.current_animations:
-            if scene_time >= start_time:
-                if not anim.completed:
-                    return False
-
-        max_start_time = max(start_time for start_time, _ in self.current_animations)
-        if scene_time < max_start_time:
+        # Sorted by start time: until the last animation has started the phase
+        # can't be complete, and once it has every animation is active
+        if scene_time < self.current_animations[-1][0]:
             return False
 
+        # Completed animations stay completed until the phase restarts, so resume
+        # the scan at the first one not yet seen complete
+        animations = self.current_animations
+        for i in range(self._completed_prefix, len(animations)):
+            if not animations[i][1].completed:
+                self._completed_prefix = i
+                return False
+
+        self._completed_prefix = len(animations)
         return True
 
+    def _advance_phase(self, scene_time: float):
+        """
+        Per-frame phase bookkeeping: signal waiters when the current phase completes,
+        then move entrance -> idle (or no phase) and restart idle.
+        """
+        if not self._check_phase_complete(scene_time):
+            return
+
+        done_event = self._phase_done_events.pop(self._current_phase, None)
+        if done_event is not None:
+            done_event.set()
+
+        if self._current_phase == "entrance":
+            if self.idle_animations:
+                logger.debug("Entrance phase complete, transitioning to idle")
+                self.set_animation_phase("idle")
+            else:
+                logger.debug("Entrance phase complete, no idle animations - clearing phase")
+                self.set_animation_phase(None)
+        elif self._current_phase == "idle":
+            logger.debug("Idle phase complete, restarting idle")
+            self.set_animation_phase("idle")
+
     async def await_phase_complete(
         self,
         phase: Optional[str] = None,
         timeout: Optional[float] = None,
-        poll_interval: float = 0.1,
+        poll_interval: Optional[float] = None,
         wait_one_cycle: bool = False,
     ) -> bool:
-        """Wait for the current animation phase to complete."""
-        from .animation import Loop
+        """
+        Wait for an animation phase to complete.
+
+        Args:
+            phase: Phase to wait for (None = the phase current at call time)
+            timeout: Give up after this many seconds (None = wait forever)
+            poll_interval: Deprecated and ignored - completion is signalled by
+                the render loop. Passing it emits a DeprecationWarning.
+            wait_one_cycle: For looping phases, return after one loop cycle
+
+        Returns:
+            True if the phase completed, False on timeout
+        """
+        if poll_interval is not None:
+            warnings.warn(
+                "await_phase_complete(poll_interval=...) is deprecated and ignored; "
+                "phase completion is signalled by the render loop",
+                DeprecationWarning,
+                stacklevel=2,
+            )
 
-        start_wait = time.time()
+        start_wait = time.monotonic()
+        if phase is None:
+            phase = self._current_phase
 
         one_cycle_duration = None
         if wait_one_cycle:
             for start_time, anim in self.current_animations:
                 if isinstance(anim, Loop):
-                    if hasattr(anim, "animation") and hasattr(anim.animation, "duration"):
-                        one_cycle_duration = anim.animation.duration
-                        logger.debug(
-                            f"Detected Loop animation with cycle duration: {one_cycle_duration:.2f}s"
-                        )
-                        break
-
-        while True:
-            if phase is not None and self._current_phase != phase:
-                if timeout and (time.time() - start_wait) >= timeout:
-                    logger.warning(
-                        f"Timeout waiting for phase '{phase}' (current: '{self._current_phase}')"
-                    )
-                    return False
-                await asyncio.sleep(poll_interval)
-                continue
-
-            if wait_one_cycle and one_cycle_duration:
-                elapsed = time.time() - start_wait
-                if elapsed >= one_cycle_duration:
+                    one_cycle_duration = anim.animation.duration
                     logger.debug(
-                        f"One cycle of phase '{self._current_phase}' complete after {elapsed:.3f}s"
+                        "Detected Loop animation with cycle duration: %.2fs", one_cycle_duration
                     )
-                    return True
+                    break
 
-            scene_time = self._time if hasattr(self, "_time") else 0.0
-            if self._check_phase_complete(scene_time):
-                logger.debug(
-                    f"Phase '{self._current_phase}' complete after {time.time() - start_wait:.3f}s"
-                )
-                return True
+        if self._current_phase == phase and self._check_phase_complete(self._time):
+            logger.debug("Phase '%s' already complete", phase)
+            return True
 
-            if timeout and (time.time() - start_wait) >= timeout:
-                logger.warning(f"Timeout waiting for phase '{self._current_phase}' to complete")
-                return False
+        # Woken by _advance_phase when the phase completes
+        done_event = self._phase_done_events.setdefault(phase, asyncio.Event())
 
-            await asyncio.sleep(poll_interval)
+        wait_time = timeout
+        if wait_one_cycle and one_cycle_duration:
+            wait_time = one_cycle_duration if timeout is None else min(timeout, one_cycle_duration)
+
+        try:
+            await asyncio.wait_for(done_event.wait(), wait_time)
+        except asyncio.TimeoutError:
+            elapsed = time.monotonic() - start_wait
+            if wait_one_cycle and one_cycle_duration and elapsed >= one_cycle_duration:
+                if self._current_phase == phase:
+                    logger.debug("One cycle of phase '%s' complete after %.3fs", phase, elapsed)
+                    return True
+            logger.warning(
+                "Timeout waiting for phase '%s' to complete (current: '%s')",
+                phase,
+                self._current_phase,
+            )
+            return False
+
+        logger.debug("Phase '%s' complete after %.3fs", phase, time.monotonic() - start_wait)
+        return True
 
     def on_enter(self):
         """Called when scene becomes active. Starts entrance phase."""
@@ -440,72 +681,113 @@ class Scene(Component):
         self.set_animation_phase("exit")
 
     def set_display_callback(self, callback: Callable[[RenderBuffer], None]):
-        """Set callback function to display rendered buffer."""
+        """
+        Set callback function to display rendered buffer.
+
+        The callback is called inline on the event loop thread after each new
+        frame, so it should return quickly; a display that is slow to drain
+        (e.g. TerminalDisplayTarget) hands the write off to its own thread.
+        """
         self._display_callback = callback
 
     def set_fps(self, fps: int):
         """Set target frames per second for standalone mode."""
         self._fps = fps
 
+    def set_threaded_render(self, threaded: bool):
+        """
+        Render frames on a worker thread instead of the event loop (standalone mode).
+
+        Off by default. Rendering reads children, animations and phase state
+        without locking, so only enable this if the scene is not modified from
+        the event loop while start_async() runs (no add_child/remove_child,
+        set_animation_phase or state edits).
+        """
+        self._threaded_render = threaded
+
     async def start_async(self, duration: Optional[float] = None):
         """Start the render loop (async, standalone mode)."""
         self._running = True
         self._time = 0.0
-        start_time = time.time()
+        # Monotonic integer clock: immune to wall-clock jumps, no float drift in pacing
+        start_ns = time.monotonic_ns()
+        start_time = start_ns * 1e-9
 
         if self._scene_start_time is None:
             self._scene_start_time = start_time
 
+        # Waiters from a previous run belong to a different event loop
+        self._phase_done_events.clear()
+
         self.on_enter()
 
-        frame_duration = 1.0 / self._fps
+        frame_duration_ns = 1_000_000_000 // self._fps
+        # Frames are scheduled on fixed deadlines so pacing doesn't drift
+        next_deadline_ns = start_ns + frame_duration_ns
+
+        loop = asyncio.get_running_loop()
+        if self._threaded_render:
+            self._render_executor = ThreadPoolExecutor(max_workers=1)
 
         try:
             frame_count = 0
+            # Unchanged scene state hits the render cache and returns the same buffer
+            # object, so identity tells us whether the frame needs to be pushed again
+            last_displayed = None
             while self._running:
-                frame_start = time.time()
+                frame_start_ns = time.monotonic_ns()
                 frame_count += 1
 
-                self._time = time.time() - start_time
-                scene_time = self._time - (
+                now = (frame_start_ns - start_ns) * 1e-9
+                self._time = now
+                scene_time = now - (
                     self._scene_start_time - start_time if self._scene_start_time else 0
                 )
 
-                if self._current_phase == "entrance" and self._check_phase_complete(scene_time):
-                    if self.idle_animations:
-                        logger.debug(f"Entrance phase complete, transitioning to idle")
-                        self.set_animation_phase("idle")
-                    else:
-                        logger.debug(
-                            f"Entrance phase complete, no idle animations - clearing phase"
-                        )
-                        self.set_animation_phase(None)
-                elif self._current_phase == "idle" and self._check_phase_complete(scene_time):
-                    logger.debug(f"Idle phase complete, restarting idle")
-                    self.set_animation_phase("idle")
+                self._advance_phase(scene_time)
 
-                buffer = self.render(self._time)
+                if self._render_executor is not None:
+                    buffer = await loop.run_in_executor(
+                        self._render_executor, self.render, now
+                    )
+                else:
+                    buffer = self.render(now)
 
-                if self._display_callback:
+                if self._display_callback and buffer is not last_displayed:
                     self._display_callback(buffer)
+                    last_displayed = buffer
 
                 if frame_count % 30 == 0 or self._current_phase == "exit":
                     logger.info(
-                        f"Render loop: frame {frame_count}, phase={self._current_phase}, time={self._time:.3f}"
+                        "Render loop: frame %d, phase=%s, time=%.3f",
+                        frame_count,
+                        self._current_phase,
+                        now,
                     )
 
-                if duration and self._time >= duration:
+                if duration and now >= duration:
                     break
 
-                frame_elapsed = time.time() - frame_start
-                sleep_time = max(0, frame_duration - frame_elapsed)
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
+                now_ns = time.monotonic_ns()
+                sleep_ns = next_deadline_ns - now_ns
+                if sleep_ns > _MIN_SLEEP_NS:
+                    await asyncio.sleep(sleep_ns * 1e-9)
+                else:
+                    # Too short to be worth a timer, or already late: just yield so
+                    # other tasks (e.g. phase waiters) still get to run
+                    await asyncio.sleep(0)
+                    if sleep_ns < -frame_duration_ns:
+                        # Fell more than a frame behind - resync instead of bursting to catch up
+                        next_deadline_ns = now_ns
+                next_deadline_ns += frame_duration_ns
 
         except asyncio.CancelledError:
             pass
         finally:
             self._running = False
+            if self._render_executor is not None:
+                self._render_executor.shutdown(wait=True)
+                self._render_executor = None
 
     def stop(self):
         """Stop the render loop."""
@@ -530,12 +812,10 @@ class Scene(Component):
         self.on_exit()
 
         if self.exit_animations:
-            max_duration = max(
-                (start_time + anim.duration) for start_time, anim in self.exit_animations
-            )
-            logger.info(f"Waiting {max_duration:.3f}s for exit animations to complete")
+            max_duration = self._phase_max_end["exit"]
+            logger.info("Waiting %.3fs for exit animations to complete", max_duration)
             await asyncio.sleep(max_duration)
-            logger.info(f"Exit animations wait complete")
+            logger.info("Exit animations wait complete")
 
         logger.info("Stopping render loop")
         self.stop()
@@ -545,20 +825,12 @@ class Scene(Component):
 
     def apply_all(self, animation_type, **kwargs):
         """Apply an animation to all children in the scene."""
-        from .animation import slide_in_all, slide_out_all, fade_in_all, fade_out_all
-
         if isinstance(animation_type, str):
-            type_map = {
-                "slide_in": slide_in_all,
-                "slide_out": slide_out_all,
-                "fade_in": fade_in_all,
-                "fade_out": fade_out_all,
-            }
-            if animation_type not in type_map:
+            animation_helper = _APPLY_ALL_MAP.get(animation_type)
+            if animation_helper is None:
                 raise ValueError(
-                    f"Unknown animation type: {animation_type}. Use: {list(type_map.keys())}"
+                    f"Unknown animation type: {animation_type}. Use: {list(_APPLY_ALL_MAP)}"
                 )
-            animation_helper = type_map[animation_type]
         else:
             animation_helper = animation_type
 
@@ -566,38 +838,39 @@ class Scene(Component):
 
     def debug_state(self, log_to_file: bool = True, print_to_console: bool = True) -> str:
         """Generate debug output showing all component positions, dimensions, and animation states."""
-        scene_time = self._time if hasattr(self, "_time") else 0.0
-
-        lines = []
-        lines.append("=" * 80)
-        lines.append(f"SCENE DEBUG STATE (time={scene_time:.3f}s)")
-        lines.append("=" * 80)
-        lines.append(f"Scene dimensions: {self._width}x{self._height}")
-        lines.append(f"Current phase: {self._current_phase}")
-        lines.append(f"Active animations: {len(self.current_animations)}")
-        lines.append(f"Focused child: {self._focused_child}")
-        lines.append("")
+        scene_time = self._time
+
+        parts = [
+            _DEBUG_HEADER_TEMPLATE.format_map(
+                {
+                    "rule": "=" * 80,
+                    "time": scene_time,
+                    "width": self._width,
+                    "height": self._height,
+                    "phase": self._current_phase,
+                    "num_anims": len(self.current_animations),
+                    "focused": self._focused_child,
+                }
+            ),
+            "",
+        ]
 
         sorted_children = sorted(
             self.children.items(), key=lambda item: item[1].state.get("z_index", 0)
         )
 
         for child_id, instance in sorted_children:
-            lines.append(f"Component: '{child_id}'")
-            lines.append(f"  Type: {type(instance.component).__name__}")
-            lines.append(f"  Dimensions: {instance.component.width}x{instance.component.height}")
-
+            component = instance.component
             x = instance.state.get("x", 0)
             y = instance.state.get("y", 0)
-            lines.append(f"  Position: x={x}, y={y}")
 
             in_bounds_x = 0 <= x < self._width
             in_bounds_y = 0 <= y < self._height
             fully_visible = (
                 0 <= x
-                and x + instance.component.width <= self._width
+                and x + component.width <= self._width
                 and 0 <= y
-                and y + instance.component.height <= self._height
+                and y + component.height <= self._height
             )
 
             if fully_visible:
@@ -605,49 +878,63 @@ class Scene(Component):
             elif (
                 in_bounds_x
                 or in_bounds_y
-                or (x + instance.component.width > 0 and y + instance.component.height > 0)
+                or (x + component.width > 0 and y + component.height > 0)
             ):
                 visibility = "PARTIALLY VISIBLE"
             else:
                 visibility = "OFF CANVAS"
-            lines.append(f"  Visibility: {visibility}")
 
-            lines.append(f"  Opacity: {instance.state.get('opacity', 1.0)}")
-            lines.append(f"  Z-index: {instance.state.get('z_index', 0)}")
-            lines.append(f"  Focused: {instance.component.focused}")
-            lines.append(f"  Focusable: {instance.component.is_focusable()}")
-
-            active_anims = [
-                (start_time, anim)
-                for start_time, anim in self.current_animations
-                if anim.target == child_id
-            ]
+            active_anims = self._anims_by_target.get(child_id, [])
 
             if active_anims:
-                lines.append(f"  Active animations: {len(active_anims)}")
+                anim_lines = [str(len(active_anims))]
                 for start_time, anim in active_anims:
                     elapsed = max(0.0, scene_time - start_time)
                     progress = min(1.0, elapsed / anim.duration) if anim.duration > 0 else 1.0
-                    lines.append(
-                        f"    - {type(anim).__name__}: progress={progress:.2%}, "
-                        f"elapsed={elapsed:.3f}s/{anim.duration:.3f}s, "
-                        f"completed={anim.completed}"
+                    anim_lines.append(
+                        _DEBUG_ANIM_TEMPLATE.format_map(
+                            {
+                                "type": type(anim).__name__,
+                                "progress": progress,
+                                "elapsed": elapsed,
+                                "duration": anim.duration,
+                                "completed": anim.completed,
+                            }
+                        )
                     )
 
                     if hasattr(anim, "to_params_int"):
-                        lines.append(f"      Animating (int): {anim.to_params_int}")
+                        anim_lines.append(f"      Animating (int): {anim.to_params_int}")
                     if hasattr(anim, "to_params_float"):
-                        lines.append(f"      Animating (float): {anim.to_params_float}")
+                        anim_lines.append(f"      Animating (float): {anim.to_params_float}")
+                anims = "\n".join(anim_lines)
             else:
-                lines.append(f"  Active animations: None")
-
-            lines.append("")
+                anims = "None"
+
+            parts.append(
+                _DEBUG_CHILD_TEMPLATE.format_map(
+                    {
+                        "id": child_id,
+                        "type": type(component).__name__,
+                        "width": component.width,
+                        "height": component.height,
+                        "x": x,
+                        "y": y,
+                        "visibility": visibility,
+                        "opacity": instance.state.get("opacity", 1.0),
+                        "z_index": instance.state.get("z_index", 0),
+                        "focused": component.focused,
+                        "focusable": component.is_focusable(),
+                        "anims": anims,
+                    }
+                )
+            )
+            parts.append("")
 
-        output = "\n".join(lines)
+        output = "\n".join(parts)
 
-        if log_to_file:
-            for line in lines:
-                logger.info(line)
+        if log_to_file and logger.isEnabledFor(logging.INFO):
+            logger.info("%s", output)
 
         if print_to_console:
             print(output)
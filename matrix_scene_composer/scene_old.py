@@ -1,25 +1,64 @@
 """Scene - Container for components with positioning and layering."""
 
 import asyncio
+import bisect
+import os
 import time
 import logging
 from typing import Dict, Tuple, Optional, List, Callable
+from .animation import slide_in_all, slide_out_all, fade_in_all, fade_out_all
 from .component import Component, DEBUG
 from .render_buffer import RenderBuffer
 
-# Setup logging to file
-logging.basicConfig(
-    filename='/tmp/animation_demo.log',
-    level=logging.DEBUG,
-    format='%(asctime)s.%(msecs)03d - %(message)s',
-    datefmt='%H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
+# Shortest frame-pacing sleep (seconds) worth a timer; shorter waits just yield
+_MIN_SLEEP = 0.002
+
+
+def _z_index_key(item: Tuple[str, 'ComponentInstance']) -> int:
+    """Sort key for (component_id, instance) pairs."""
+    return item[1].z_index
+
+
+# Animation helpers accepted by name in Scene.apply_all
+_APPLY_ALL_MAP = {
+    'slide_in': slide_in_all,
+    'slide_out': slide_out_all,
+    'fade_in': fade_in_all,
+    'fade_out': fade_out_all,
+}
+
+
+# File handler installed by enable_debug_logging, if any
+_debug_handler: Optional[logging.FileHandler] = None
+
+
+def enable_debug_logging(path: str = '/tmp/animation_demo.log'):
+    """
+    Log scene and animation phase activity at DEBUG level to a file.
+
+    Calling it again for the same file keeps the existing handler; a different
+    path replaces it, so records are never written twice.
+    """
+    global _debug_handler
+    if _debug_handler is None or _debug_handler.baseFilename != os.path.abspath(path):
+        if _debug_handler is not None:
+            logger.removeHandler(_debug_handler)
+            _debug_handler.close()
+        _debug_handler = logging.FileHandler(path)
+        _debug_handler.setFormatter(
+            logging.Formatter('%(asctime)s.%(msecs)03d - %(message)s', datefmt='%H:%M:%S')
+        )
+        logger.addHandler(_debug_handler)
+    logger.setLevel(logging.DEBUG)
+
 
 class ComponentInstance:
     """Wrapper for component with positioning and rendering properties."""
 
+    __slots__ = ('component', 'position', 'z_index', 'opacity')
+
     def __init__(self, component: Component, position: Tuple[int, int], z_index: int, opacity: float):
         self.component = component
         self.position = position
@@ -55,7 +94,11 @@ class Scene:
             raise ValueError("Must provide either 'size' or both 'width' and 'height'")
 
         self.components: Dict[str, ComponentInstance] = {}
+        # (component_id, instance) pairs kept sorted by z_index as components change
+        self._sorted_components: List[Tuple[str, ComponentInstance]] = []
         self.canvas = RenderBuffer(self.width, self.height)
+        # (buffer, position, opacity) per blitted component in the last render
+        self._last_layers: Optional[List[Tuple[RenderBuffer, Tuple[int, int], float]]] = None
 
         # Animation phases
         self.entrance_animations = entrance_animations or []
@@ -64,6 +107,7 @@ class Scene:
 
         # Current active animations
         self.current_animations: List[Tuple[float, 'Animation']] = []
+        self._max_start_time = float('-inf')  # Latest start time among current animations
         self._scene_start_time: Optional[float] = None
         self._current_phase: Optional[str] = None  # 'entrance', 'idle', or 'exit'
 
@@ -91,17 +135,50 @@ class Scene:
             z_index: Layer order (higher = on top)
             opacity: Component opacity (0.0 to 1.0)
         """
-        self.components[component_id] = ComponentInstance(
+        if component_id in self.components:
+            self._unlink_sorted(component_id)
+
+        instance = ComponentInstance(
             component=component,
             position=position,
             z_index=z_index,
             opacity=opacity
         )
+        self.components[component_id] = instance
+        bisect.insort(self._sorted_components, (component_id, instance), key=_z_index_key)
 
     def remove_component(self, component_id: str):
         """Remove component from scene."""
         if component_id in self.components:
             del self.components[component_id]
+            self._unlink_sorted(component_id)
+
+    def set_z_index(self, component_id: str, z_index: int):
+        """Change a component's z_index, moving it to its new place in the render order."""
+        instance = self.components[component_id]
+        self._unlink_sorted(component_id)
+        instance.z_index = z_index
+        bisect.insort(self._sorted_components, (component_id, instance), key=_z_index_key)
+
+    def _unlink_sorted(self, component_id: str):
+        """Remove a component's entry from the z_index-sorted list."""
+        for i, (cid, _) in enumerate(self._sorted_components):
+            if cid == component_id:
+                del self._sorted_components[i]
+                return
+
+    def _get_sorted_components(self) -> List[Tuple[str, ComponentInstance]]:
+        """
+        Get (component_id, instance) pairs in z_index order (low to high).
+
+        The list is maintained incrementally by add_component, remove_component
+        and set_z_index; it is only re-sorted if a z_index was assigned directly
+        on an instance so that the order is no longer ascending.
+        """
+        ordered = self._sorted_components
+        if any(ordered[i][1].z_index > ordered[i + 1][1].z_index for i in range(len(ordered) - 1)):
+            ordered.sort(key=_z_index_key)
+        return ordered
 
     def add_animation(self, animation: 'Animation', start_time: float = 0.0):
         """
@@ -112,10 +189,13 @@ class Scene:
             start_time: Time relative to scene start when animation should begin
         """
         self.current_animations.append((start_time, animation))
+        if start_time > self._max_start_time:
+            self._max_start_time = start_time
 
     def clear_animations(self):
         """Clear all current animations."""
         self.current_animations.clear()
+        self._max_start_time = float('-inf')
 
     def _start_phase(self, phase: str, current_scene_time: float = 0.0):
         """
@@ -125,7 +205,7 @@ class Scene:
             phase: 'entrance', 'idle', or 'exit'
             current_scene_time: Current scene time (for scheduling animations relative to now)
         """
-        logger.info(f"Scene._start_phase('{phase}') called at scene_time={current_scene_time:.3f}")
+        logger.info("Scene._start_phase('%s') called at scene_time=%.3f", phase, current_scene_time)
         self._current_phase = phase
         self.clear_animations()
         # DO NOT reset _scene_start_time - scene time should be monotonic!
@@ -136,15 +216,15 @@ class Scene:
         if phase == 'entrance':
             for start_time, anim in self.entrance_animations:
                 self.add_animation(anim, current_scene_time + start_time)
-            logger.info(f"  Loaded {len(self.entrance_animations)} entrance animations")
+            logger.info("  Loaded %d entrance animations", len(self.entrance_animations))
         elif phase == 'idle':
             for start_time, anim in self.idle_animations:
                 self.add_animation(anim, current_scene_time + start_time)
-            logger.info(f"  Loaded {len(self.idle_animations)} idle animations")
+            logger.info("  Loaded %d idle animations", len(self.idle_animations))
         elif phase == 'exit':
             for start_time, anim in self.exit_animations:
                 self.add_animation(anim, current_scene_time + start_time)
-            logger.info(f"  Loaded {len(self.exit_animations)} exit animations")
+            logger.info("  Loaded %d exit animations", len(self.exit_animations))
 
     def _check_phase_complete(self, scene_time: float) -> bool:
         """
@@ -167,9 +247,10 @@ class Scene:
                     return False
 
         # Also check if all animations have at least started
-        # (scene_time must be past the last animation's start time)
-        max_start_time = max(start_time for start_time, _ in self.current_animations)
-        if scene_time < max_start_time:
+        # (scene_time must be past the last animation's start time).
+        # Completed animations dropped from the list had already started, so the
+        # latest start time ever added gives the same answer as the remaining max.
+        if scene_time < self._max_start_time:
             return False
 
         return True
@@ -191,64 +272,75 @@ class Scene:
         if self._scene_start_time is None:
             self._scene_start_time = time
 
-        scene_time = time - self._scene_start_time
+        scene_start_time = self._scene_start_time
+        scene_time = time - scene_start_time
 
-        # Update animations (modifies ComponentInstance properties)
-        for start_time, anim in self.current_animations[:]:  # Copy list since we may remove
+        # Update animations (modifies ComponentInstance properties), keeping the
+        # unfinished ones in a single pass instead of list.remove() per completion
+        survivors = []
+        for start_time, anim in self.current_animations:
             # Check if animation target exists
-            if anim.target not in self.components:
+            instance = self.components.get(anim.target)
+            if instance is None:
+                survivors.append((start_time, anim))
                 continue
 
-            instance = self.components[anim.target]
-
-            # Calculate when this animation should actually start (global time)
-            anim_start_time = self._scene_start_time + start_time
-
             # Always call update, but pass the animation's start time if we haven't reached it yet
             # This ensures from_params are applied at progress=0
             if scene_time < start_time:
-                # Call update with the animation's start time (elapsed will be 0)
-                anim.update(instance, anim_start_time)
-            else:
-                # Update animation with current time
-                if anim.update(instance, time):
-                    # Animation completed - remove it
-                    self.current_animations.remove((start_time, anim))
+                # Call update with the animation's (global) start time (elapsed will be 0)
+                anim.update(instance, scene_start_time + start_time)
+                survivors.append((start_time, anim))
+            elif not anim.update(instance, time):
+                # Still running (completed animations are dropped)
+                survivors.append((start_time, anim))
+        self.current_animations = survivors
 
         # Check if current phase is complete and transition to next phase
         if self._current_phase == 'entrance' and self._check_phase_complete(scene_time):
             if self.idle_animations:
-                logger.info(f"Entrance phase complete at scene_time={scene_time:.3f}, transitioning to idle")
+                logger.info("Entrance phase complete at scene_time=%.3f, transitioning to idle", scene_time)
                 self._start_phase('idle', scene_time)
         elif self._current_phase == 'idle' and self._check_phase_complete(scene_time):
             # Idle phase complete - restart idle animations (loop forever)
-            logger.info(f"Idle phase complete at scene_time={scene_time:.3f}, restarting idle")
+            logger.info("Idle phase complete at scene_time=%.3f, restarting idle", scene_time)
             self._start_phase('idle', scene_time)
 
-        # Clear canvas
-        self.canvas.clear()
-
-        # Sort components by z_index (low to high)
-        sorted_instances = sorted(
-            self.components.values(),
-            key=lambda inst: inst.z_index
-        )
+        # Render each component in z_index order (low to high)
+        layers = []
+        for comp_id, instance in self._get_sorted_components():
+            # Skip components that would contribute no pixels: fully transparent
+            # (e.g. held at opacity 0 before a fade-in) or entirely off the canvas
+            if instance.opacity <= 0.0:
+                continue
+            component = instance.component
+            px, py = instance.position
+            if (
+                px >= self.width
+                or py >= self.height
+                or px + component.width <= 0
+                or py + component.height <= 0
+            ):
+                continue
 
-        # Render each component
-        for comp_id, instance in [(id, inst) for id, inst in self.components.items()]:
             if DEBUG:
                 component_name = instance.component.__class__.__name__
                 print(f"  Rendering component '{comp_id}' ({component_name}) at position {instance.position}")
 
             # Get component to render itself
-            component_buffer = instance.component.render(time)
+            layers.append((component.render(time), instance.position, instance.opacity))
 
-            # Blit component buffer to scene canvas at position
-            self.canvas.blit(
-                component_buffer,
-                instance.position,
-                instance.opacity
-            )
+        # Components return their cached buffer while unchanged, so if every layer
+        # has the same buffer, position and opacity as last frame (animations and
+        # add/remove show up here too), the canvas already holds this frame
+        if layers == self._last_layers:
+            return self.canvas
+        self._last_layers = layers
+
+        # Clear canvas and blit component buffers at their positions
+        self.canvas.clear()
+        for component_buffer, position, opacity in layers:
+            self.canvas.blit(component_buffer, position, opacity)
 
         return self.canvas
 
@@ -269,19 +361,11 @@ class Scene:
             scene.apply_all('slide_out', duration=2.0)
             scene.apply_all('fade_in', start_time=0.5, duration=1.5)
         """
-        from .animation import slide_in_all, slide_out_all, fade_in_all, fade_out_all
-
         # Support string types
         if isinstance(animation_type, str):
-            type_map = {
-                'slide_in': slide_in_all,
-                'slide_out': slide_out_all,
-                'fade_in': fade_in_all,
-                'fade_out': fade_out_all,
-            }
-            if animation_type not in type_map:
-                raise ValueError(f"Unknown animation type: {animation_type}. Use: {list(type_map.keys())}")
-            animation_helper = type_map[animation_type]
+            animation_helper = _APPLY_ALL_MAP.get(animation_type)
+            if animation_helper is None:
+                raise ValueError(f"Unknown animation type: {animation_type}. Use: {list(_APPLY_ALL_MAP)}")
         else:
             # Backward compatibility: support passing function directly
             animation_helper = animation_type
@@ -307,7 +391,7 @@ class Scene:
             else:
                 current_scene_time = 0.0
 
-        logger.info(f"Scene.on_exit() called at scene_time={current_scene_time:.3f}")
+        logger.info("Scene.on_exit() called at scene_time=%.3f", current_scene_time)
         self._start_phase('exit', current_scene_time)
 
     def set_display_callback(self, callback: Callable[[RenderBuffer], None]):
@@ -332,17 +416,19 @@ class Scene:
         """
         self._running = True
         self._time = 0.0
-        start_time = time.time()
+        # Monotonic clock: wall-clock time can jump under NTP adjustments
+        start_time = time.monotonic()
 
         # Start entrance animations
         self.on_enter()
 
         frame_duration = 1.0 / self._fps
+        # Frames are scheduled on fixed deadlines so pacing doesn't drift
+        next_deadline = start_time + frame_duration
 
         try:
             frame_count = 0
             while self._running:
-                frame_start = time.time()
                 frame_count += 1
 
                 # Render frame
@@ -353,21 +439,34 @@ class Scene:
                     self._display_callback(buffer)
 
                 # Log every 30 frames (once per second at 30fps) and during exit phase
-                if frame_count % 30 == 0 or self._current_phase == 'exit':
-                    logger.info(f"Render loop: frame {frame_count}, phase={self._current_phase}, time={self._time:.3f}")
-
-                # Update time
-                self._time = time.time() - start_time
+                if logger.isEnabledFor(logging.INFO) and (
+                    frame_count % 30 == 0 or self._current_phase == 'exit'
+                ):
+                    logger.info(
+                        "Render loop: frame %d, phase=%s, time=%.3f",
+                        frame_count, self._current_phase, self._time
+                    )
+
+                # Update time (one clock read serves time, duration and pacing)
+                now = time.monotonic()
+                self._time = now - start_time
 
                 # Check duration
                 if duration and self._time >= duration:
                     break
 
-                # Sleep to maintain target FPS (async)
-                frame_elapsed = time.time() - frame_start
-                sleep_time = max(0, frame_duration - frame_elapsed)
-                if sleep_time > 0:
+                # Sleep until the next frame deadline (async)
+                sleep_time = next_deadline - now
+                if sleep_time > _MIN_SLEEP:
                     await asyncio.sleep(sleep_time)
+                else:
+                    # Too short to be worth a timer, or already late: just yield so
+                    # other tasks still get to run
+                    await asyncio.sleep(0)
+                    if sleep_time < -frame_duration:
+                        # Fell more than a frame behind - resync instead of bursting to catch up
+                        next_deadline = now
+                next_deadline += frame_duration
 
         except asyncio.CancelledError:
             pass
@@ -409,10 +508,10 @@ class Scene:
         # We cannot call stop() yet because that would stop rendering frames.
         if self.exit_animations:
             max_duration = max((start_time + anim.duration) for start_time, anim in self.exit_animations)
-            logger.info(f"Waiting {max_duration:.3f}s for exit animations to complete")
+            logger.info("Waiting %.3fs for exit animations to complete", max_duration)
             # Sleep while the render loop continues to run and show exit animations
             await asyncio.sleep(max_duration)
-            logger.info(f"Exit animations wait complete")
+            logger.info("Exit animations wait complete")
 
         # NOW stop the scene after animations have been displayed
         logger.info("Stopping render loop")
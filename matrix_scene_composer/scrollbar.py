@@ -1,7 +1,10 @@
 """Scrollbar component for LED matrix displays."""
 
 from typing import Tuple, Literal
-from .component import Component, cache_with_dict
+
+import numpy as np
+
+from .component import Component
 from .render_buffer import RenderBuffer
 
 
@@ -15,6 +18,9 @@ class Scrollbar(Component):
     - Automatically calculates thumb size based on viewport/content ratio
     """
 
+    # render() has no side effects, so a Scene may skip it while offscreen
+    render_offscreen_skippable = True
+
     def __init__(
         self,
         width: int,
@@ -47,15 +53,32 @@ class Scrollbar(Component):
 
         self._width = width
         self._height = height
-        self.orientation = orientation
+        self._orientation = orientation
         self.viewport_size = viewport_size
         self.content_size = content_size
         self.scroll_position = scroll_position
-        self.track_color = track_color
-        self.thumb_color = thumb_color
-        self.arrow_color = arrow_color
+        self._track_color = track_color
+        self._thumb_color = thumb_color
+        self._arrow_color = arrow_color
         self.min_thumb_size = min_thumb_size
 
+        # Bumped whenever orientation or a color changes - part of the render state
+        self._style_version = 0
+        self._restyle()
+
+    def _restyle(self):
+        """Recompute orientation-dependent geometry and drop the rendered buffer."""
+        # Scrolling axis of the pixel array (0 = rows, 1 = columns)
+        self._axis = 0 if self._orientation == "vertical" else 1
+        # Arrow pixel indices depend only on size and orientation
+        self._arrow_ys, self._arrow_xs = self._compute_arrow_coords()
+
+        # One-slot render cache: (style_version, viewport_size, content_size,
+        # scroll_position) -> buffer
+        self._style_version += 1
+        self._cache_key: Tuple[int, int, int, int] | None = None
+        self._cache_buffer: RenderBuffer | None = None
+
     @property
     def width(self) -> int:
         return self._width
@@ -64,6 +87,42 @@ class Scrollbar(Component):
     def height(self) -> int:
         return self._height
 
+    @property
+    def orientation(self) -> Literal["horizontal", "vertical"]:
+        return self._orientation
+
+    @orientation.setter
+    def orientation(self, orientation: Literal["horizontal", "vertical"]):
+        self._orientation = orientation
+        self._restyle()
+
+    @property
+    def track_color(self) -> Tuple[int, int, int]:
+        return self._track_color
+
+    @track_color.setter
+    def track_color(self, color: Tuple[int, int, int]):
+        self._track_color = color
+        self._restyle()
+
+    @property
+    def thumb_color(self) -> Tuple[int, int, int]:
+        return self._thumb_color
+
+    @thumb_color.setter
+    def thumb_color(self, color: Tuple[int, int, int]):
+        self._thumb_color = color
+        self._restyle()
+
+    @property
+    def arrow_color(self) -> Tuple[int, int, int] | None:
+        return self._arrow_color
+
+    @arrow_color.setter
+    def arrow_color(self, color: Tuple[int, int, int] | None):
+        self._arrow_color = color
+        self._restyle()
+
     def set_scroll_position(self, position: int):
         """Set scroll position."""
         max_scroll = max(0, self.content_size - self.viewport_size)
@@ -74,111 +133,91 @@ class Scrollbar(Component):
         self.content_size = size
         self.set_scroll_position(self.scroll_position)  # Clamp position
 
+    def _compute_arrow_coords(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Row and column indices of the in-bounds arrow indicator pixels."""
+        w, h = self._width, self._height
+        if self._axis == 0:  # vertical
+            mid_x = w // 2
+            # Up arrow (top), down arrow (bottom)
+            points = [(mid_x, 0), (mid_x, h - 1)]
+            if w >= 3:
+                points += [(mid_x - 1, 1), (mid_x + 1, 1), (mid_x - 1, h - 2), (mid_x + 1, h - 2)]
+        else:  # horizontal
+            mid_y = h // 2
+            # Left arrow, right arrow
+            points = [(0, mid_y), (w - 1, mid_y)]
+            if h >= 3:
+                points += [(1, mid_y - 1), (1, mid_y + 1), (w - 2, mid_y - 1), (w - 2, mid_y + 1)]
+
+        points = [(x, y) for x, y in points if 0 <= x < w and 0 <= y < h]
+        ys = np.array([y for _, y in points], dtype=np.intp)
+        xs = np.array([x for x, _ in points], dtype=np.intp)
+        return ys, xs
+
     def compute_state(self, time: float) -> dict:
-        """Compute state - scroll position and sizes."""
+        """Compute state - scroll position and sizes, plus the style version."""
         return {
+            "style_version": self._style_version,
             "viewport_size": self.viewport_size,
             "content_size": self.content_size,
             "scroll_position": self.scroll_position,
         }
 
-    @cache_with_dict(maxsize=128)
     def _render_cached(self, state: dict, time: float) -> RenderBuffer:
-        """Render scrollbar."""
-        buffer = RenderBuffer(self._width, self._height)
-
-        viewport_size = state["viewport_size"]
-        content_size = state["content_size"]
-        scroll_position = state["scroll_position"]
-
-        # Draw track background
-        for y in range(self._height):
-            for x in range(self._width):
-                buffer.set_pixel(x, y, self.track_color)
+        """
+        Render scrollbar, reusing the last buffer while the scroll state is unchanged.
 
-        # Calculate thumb dimensions
+        The output depends only on four ints, so a one-slot cache keyed on them
+        replaces cache_with_dict's per-frame dict hashing.
+        """
+        key = (
+            state["style_version"],
+            state["viewport_size"],
+            state["content_size"],
+            state["scroll_position"],
+        )
+        if key != self._cache_key:
+            self._cache_buffer = self._render_scrollbar(*key[1:])
+            self._cache_key = key
+        return self._cache_buffer
+
+    def _render_scrollbar(
+        self, viewport_size: int, content_size: int, scroll_position: int
+    ) -> RenderBuffer:
+        """Draw track, thumb and arrows into a new buffer."""
+        # Track background and opaque alpha in one pass. A fresh buffer per miss
+        # (rather than one reused scratch buffer) is deliberate: parents may keep
+        # the returned buffer, e.g. a Scene's single-child fast path caches it.
+        buffer = RenderBuffer.filled(self._width, self._height, self.track_color)
+        pixels = buffer.data[:, :, :3]
+
+        # Calculate thumb dimensions along the scrolling axis
+        axis = self._axis
+        track_size = (self._height, self._width)[axis]
         if content_size <= viewport_size:
             # No scrolling needed - show full thumb
-            if self.orientation == "vertical":
-                thumb_size = self._height
-                thumb_position = 0
-            else:
-                thumb_size = self._width
-                thumb_position = 0
+            thumb_size = track_size
+            thumb_position = 0
         else:
             # Calculate thumb size proportional to viewport/content ratio
             max_scroll = content_size - viewport_size
-
-            if self.orientation == "vertical":
-                track_size = self._height
-                arrow_space = 2 if self.arrow_color else 0
-                available_track = track_size - (2 * arrow_space)
-
-                thumb_size = max(
-                    self.min_thumb_size, int(available_track * (viewport_size / content_size))
-                )
-                thumb_travel = available_track - thumb_size
-
-                if max_scroll > 0:
-                    thumb_position = arrow_space + int(
-                        thumb_travel * (scroll_position / max_scroll)
-                    )
-                else:
-                    thumb_position = arrow_space
-            else:  # horizontal
-                track_size = self._width
-                arrow_space = 2 if self.arrow_color else 0
-                available_track = track_size - (2 * arrow_space)
-
-                thumb_size = max(
-                    self.min_thumb_size, int(available_track * (viewport_size / content_size))
-                )
-                thumb_travel = available_track - thumb_size
-
-                if max_scroll > 0:
-                    thumb_position = arrow_space + int(
-                        thumb_travel * (scroll_position / max_scroll)
-                    )
-                else:
-                    thumb_position = arrow_space
-
-        # Draw thumb
-        if self.orientation == "vertical":
-            for y in range(thumb_position, min(thumb_position + thumb_size, self._height)):
-                for x in range(self._width):
-                    buffer.set_pixel(x, y, self.thumb_color)
-        else:  # horizontal
-            for x in range(thumb_position, min(thumb_position + thumb_size, self._width)):
-                for y in range(self._height):
-                    buffer.set_pixel(x, y, self.thumb_color)
-
-        # Draw arrows
+            arrow_space = 2 if self.arrow_color else 0
+            available_track = track_size - (2 * arrow_space)
+
+            thumb_size = max(
+                self.min_thumb_size, int(available_track * (viewport_size / content_size))
+            )
+            thumb_travel = available_track - thumb_size
+            thumb_position = arrow_space + int(thumb_travel * (scroll_position / max_scroll))
+
+        # Draw thumb as one slice along the scrolling axis (clamped to 0: negative
+        # slice indices would wrap around)
+        thumb = [slice(None), slice(None)]
+        thumb[axis] = slice(max(0, thumb_position), max(0, thumb_position + thumb_size))
+        pixels[tuple(thumb)] = self.thumb_color
+
+        # Draw arrows with a single fancy-indexed write
         if self.arrow_color:
-            if self.orientation == "vertical":
-                # Up arrow (top)
-                mid_x = self._width // 2
-                buffer.set_pixel(mid_x, 0, self.arrow_color)
-                if self._width >= 3:
-                    buffer.set_pixel(mid_x - 1, 1, self.arrow_color)
-                    buffer.set_pixel(mid_x + 1, 1, self.arrow_color)
-
-                # Down arrow (bottom)
-                if self._width >= 3:
-                    buffer.set_pixel(mid_x - 1, self._height - 2, self.arrow_color)
-                    buffer.set_pixel(mid_x + 1, self._height - 2, self.arrow_color)
-                buffer.set_pixel(mid_x, self._height - 1, self.arrow_color)
-            else:  # horizontal
-                # Left arrow
-                mid_y = self._height // 2
-                buffer.set_pixel(0, mid_y, self.arrow_color)
-                if self._height >= 3:
-                    buffer.set_pixel(1, mid_y - 1, self.arrow_color)
-                    buffer.set_pixel(1, mid_y + 1, self.arrow_color)
-
-                # Right arrow
-                if self._height >= 3:
-                    buffer.set_pixel(self._width - 2, mid_y - 1, self.arrow_color)
-                    buffer.set_pixel(self._width - 2, mid_y + 1, self.arrow_color)
-                buffer.set_pixel(self._width - 1, mid_y, self.arrow_color)
+            pixels[self._arrow_ys, self._arrow_xs] = self.arrow_color
 
         return buffer
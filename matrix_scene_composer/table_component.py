@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Literal, Tuple
 
 import numpy as np
 
-from .component import Component, cache_with_dict
+from .component import Component
 from .render_buffer import RenderBuffer
 from .text_component import TextComponent
 
@@ -24,6 +24,12 @@ class TableComponent(Component):
     - Automatic or manual scrolling support
     """
 
+    # render() has no side effects, so a Scene may skip it while offscreen
+    render_offscreen_skippable = True
+
+    # Maximum number of cached viewports (one per distinct scroll position)
+    _VIEWPORT_CACHE_SIZE = 128
+
     def __init__(
         self,
         data: List[Dict[str, Any]],
@@ -77,7 +83,8 @@ class TableComponent(Component):
         self.cell_padding = cell_padding
         self.show_borders = show_borders
         self.show_headers = show_headers
-        self.border_color = border_color
+        self._border_color = border_color
+        self._border_rgb = np.array(border_color, dtype=np.uint8)
         self.max_width = max_width
         self.max_height = max_height
         self.autoscroll = autoscroll
@@ -89,6 +96,7 @@ class TableComponent(Component):
         self.scroll_offset_y = 0
 
         # Derive headers from first dict if not provided
+        self._auto_headers = headers is None
         if headers is None:
             if data:
                 self.headers = list(data[0].keys())
@@ -97,27 +105,93 @@ class TableComponent(Component):
         else:
             self.headers = headers
 
-        # Auto-calculate column widths if not provided
-        if col_widths is None:
+        # Auto-calculate column widths if not provided (see _build_layout)
+        self._auto_col_widths = col_widths is None
+        self.col_widths = col_widths
+
+        # Bumped by set_data() - stands in for the data itself in render state
+        self._data_version = 0
+
+        self._build_layout()
+
+    def _build_layout(self):
+        """Derive column widths, dimensions, offsets and cell cache from the data."""
+        # TextComponents keyed by (text, fgcolor, bgcolor), shared between width
+        # measurement and the cell cache so each distinct cell is laid out once
+        self._text_components: Dict[Tuple, TextComponent] = {}
+
+        if self._auto_col_widths:
             self.col_widths = self._calculate_col_widths()
-        else:
-            self.col_widths = col_widths
+
+        # Every cell has the same height: a TextComponent is font_height tall
+        # plus padding on both sides, so no component is needed to measure it
+        self._row_height = self.font_height + 2 * self.cell_padding
 
         # Calculate total table dimensions (full size)
         self._full_width = self._calculate_width()
         self._full_height = self._calculate_height()
 
         # Calculate display dimensions (viewport size)
+        max_width = self.max_width
+        max_height = self.max_height
         self._display_width = min(self._full_width, max_width) if max_width else self._full_width
         self._display_height = (
             min(self._full_height, max_height) if max_height else self._full_height
         )
 
+        # Top-left pixel offset of every column and row, borders included
+        self._col_x, self._row_y = self._calculate_offsets()
+
         # Pre-render all text cells
-        self._cell_cache = self._create_cell_cache()
+        self._cell_grid = self._create_cell_grid()
+
+        self._clear_render_cache()
 
-        # Pre-render full table buffer (reused during scrolling)
+    def _clear_render_cache(self):
+        """Drop the pre-rendered full table and every cached viewport."""
+        # Pre-render full table buffer (reused during scrolling); its pixel
+        # array is kept separately for the viewport copy
         self._full_table_buffer = None
+        self._full_pixels: np.ndarray | None = None
+
+        # Rendered viewports keyed by clamped (scroll_x, scroll_y)
+        self._viewport_cache: Dict[Tuple[int, int], RenderBuffer] = {}
+        self._last_viewport_key: Tuple[int, int] | None = None
+        self._last_viewport: RenderBuffer | None = None
+
+    def set_data(self, data: List[Dict[str, Any]]):
+        """
+        Replace table data and rebuild the layout.
+
+        Auto-derived headers and column widths are recalculated; explicitly
+        provided ones are kept. Scroll offsets are clamped to the new size.
+        """
+        self.data = data
+        if self._auto_headers:
+            self.headers = list(data[0].keys()) if data else []
+        self._data_version += 1
+        self._build_layout()
+        self.scroll_to(self.scroll_offset_x, self.scroll_offset_y)
+
+    def _text_component(
+        self,
+        text: str,
+        fgcolor: Tuple[int, int, int],
+        bgcolor: Tuple[int, int, int] | None,
+    ) -> TextComponent:
+        """Get the padded TextComponent for a cell, creating it on first use."""
+        key = (text, fgcolor, bgcolor)
+        text_comp = self._text_components.get(key)
+        if text_comp is None:
+            text_comp = TextComponent(
+                text=text,
+                font_height=self.font_height,
+                fgcolor=fgcolor,
+                bgcolor=bgcolor,
+                padding=self.cell_padding,
+            )
+            self._text_components[key] = text_comp
+        return text_comp
 
     def _calculate_col_widths(self) -> List[int]:
         """Auto-calculate column widths based on content."""
@@ -127,32 +201,21 @@ class TableComponent(Component):
         col_widths = []
 
         for header in self.headers:
-            max_width = 0
-
-            # Check header width
-            header_text = TextComponent(
-                text=str(header).upper(),
-                font_height=self.font_height,
-                fgcolor=self.header_fgcolor,
-                bgcolor=None,
-                padding=0,
-            )
-            max_width = max(max_width, header_text.width)
+            # Cells are measured with cell padding already applied (text width
+            # does not depend on color), so the components are reused by
+            # _create_cell_grid
+            max_width = self._text_component(
+                str(header).upper(), self.header_fgcolor, self.header_bgcolor
+            ).width
 
             # Check data widths
             for row in self.data:
-                value = row.get(header, "")
-                cell_text = TextComponent(
-                    text=str(value).upper(),
-                    font_height=self.font_height,
-                    fgcolor=self.fgcolor,
-                    bgcolor=None,
-                    padding=0,
+                text = str(row.get(header, "")).upper()
+                max_width = max(
+                    max_width, self._text_component(text, self.fgcolor, self.bgcolor).width
                 )
-                max_width = max(max_width, cell_text.width)
 
-            # Add cell padding to width
-            col_widths.append(max_width + (2 * self.cell_padding))
+            col_widths.append(max_width)
 
         return col_widths
 
@@ -174,15 +237,7 @@ class TableComponent(Component):
         if not self.data:
             return 0
 
-        # Get row height from text component
-        dummy_text = TextComponent(
-            text="X",
-            font_height=self.font_height,
-            fgcolor=self.fgcolor,
-            bgcolor=None,
-            padding=self.cell_padding,
-        )
-        row_height = dummy_text.height
+        row_height = self._row_height
 
         # Total rows = header (if shown) + data rows
         num_rows = len(self.data) + (1 if self.show_headers else 0)
@@ -194,39 +249,44 @@ class TableComponent(Component):
 
         return total_height
 
-    def _create_cell_cache(self) -> Dict[Tuple[int, int], Component]:
-        """Pre-render all cells into cache."""
-        cache = {}
+    def _calculate_offsets(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate x offset of each column and y offset of each row."""
+        border_width = 1 if self.show_borders else 0
+        num_rows = len(self.data) + (1 if self.show_headers else 0)
+
+        col_steps = np.asarray(self.col_widths, dtype=np.intp) + border_width
+        row_steps = np.full(num_rows, self._row_height + border_width, dtype=np.intp)
+        col_x = np.concatenate(([0], np.cumsum(col_steps)))[:-1]
+        row_y = np.concatenate(([0], np.cumsum(row_steps)))[:-1]
+        return col_x, row_y
+
+    def _create_cell_grid(self) -> List[List[TextComponent]]:
+        """Pre-render all cells into a dense [row][column] grid."""
+        grid = []
 
         # Render header row (if enabled)
         if self.show_headers:
-            for col_idx, header in enumerate(self.headers):
-                text_comp = TextComponent(
-                    text=str(header).upper(),
-                    font_height=self.font_height,
-                    fgcolor=self.header_fgcolor,
-                    bgcolor=self.header_bgcolor,
-                    padding=self.cell_padding,
-                )
-                cache[(0, col_idx)] = text_comp
+            grid.append(
+                [
+                    self._text_component(
+                        str(header).upper(), self.header_fgcolor, self.header_bgcolor
+                    )
+                    for header in self.headers
+                ]
+            )
 
         # Render data rows
-        for row_idx, row_data in enumerate(self.data):
-            # Offset by 1 if we're showing headers
-            actual_row_idx = row_idx + (1 if self.show_headers else 0)
-
-            for col_idx, header in enumerate(self.headers):
-                value = row_data.get(header, "")
-                text_comp = TextComponent(
-                    text=str(value).upper(),
-                    font_height=self.font_height,
-                    fgcolor=self.fgcolor,
-                    bgcolor=self.bgcolor,
-                    padding=self.cell_padding,
-                )
-                cache[(actual_row_idx, col_idx)] = text_comp
+        for row_data in self.data:
+            grid.append(
+                [
+                    self._text_component(
+                        str(row_data.get(header, "")).upper(), self.fgcolor, self.bgcolor
+                    )
+                    for header in self.headers
+                ]
+            )
 
-        return cache
+        return grid
 
     def _render_full_table(self, time: float) -> RenderBuffer:
         """Render complete table to buffer (used for scrolling)."""
@@ -235,50 +295,28 @@ class TableComponent(Component):
 
         buffer = RenderBuffer(self._full_width, self._full_height)
 
-        # Calculate row height
-        if not self._cell_cache:
-            return buffer
-
-        # Get a sample cell to determine row height
-        sample_cell = next(iter(self._cell_cache.values()))
-        row_height = sample_cell.height
-        border_width = 1 if self.show_borders else 0
-
-        y_offset = 0
-
-        # Render each row
-        num_rows = len(self.data) + (1 if self.show_headers else 0)
-        for row_idx in range(num_rows):
-            x_offset = 0
+        # Cells with the same text and colors share one component (see
+        # _text_component), so each distinct cell is rendered only once
+        cell_pixels: Dict[int, np.ndarray] = {}
 
+        # Render each row (an empty grid leaves the blank buffer)
+        for y_offset, row in zip(self._row_y, self._cell_grid):
             # Render each column in this row
-            for col_idx in range(len(self.headers)):
-                cell_key = (row_idx, col_idx)
+            for x_offset, cell_component in zip(self._col_x, row):
+                pixels = cell_pixels.get(id(cell_component))
+                if pixels is None:
+                    pixels = cell_component.render(time).data
+                    cell_pixels[id(cell_component)] = pixels
 
-                if cell_key in self._cell_cache:
-                    cell_component = self._cell_cache[cell_key]
-                    cell_buffer = cell_component.render(time)
+                # Copy cell pixels onto table buffer
+                self._blit_pixels(buffer, pixels, x_offset, y_offset)
 
-                    # Blit cell onto table buffer
-                    self._blit_buffer(buffer, cell_buffer, x_offset, y_offset)
-
-                # Move to next column
-                x_offset += self.col_widths[col_idx]
-
-                # Add vertical border
-                if self.show_borders and col_idx < len(self.headers) - 1:
-                    self._draw_vertical_line(buffer, x_offset, y_offset, row_height)
-                    x_offset += border_width
-
-            # Move to next row
-            y_offset += row_height
-
-            # Add horizontal border
-            if self.show_borders and row_idx < num_rows - 1:
-                self._draw_horizontal_line(buffer, y_offset, self._full_width)
-                y_offset += border_width
+        # Borders go on top of the cells, so they can all be painted at the end
+        if self.show_borders:
+            self._draw_borders(buffer)
 
         self._full_table_buffer = buffer
+        self._full_pixels = buffer.data
         return buffer
 
     def _calculate_scroll_offset(self, time: float, direction: Literal["X", "Y"]) -> int:
@@ -301,21 +339,32 @@ class TableComponent(Component):
 
         # Position within current cycle
         t = time % cycle_time
+        forward_end = self.scroll_pause + scroll_time
+        back_start = (2 * self.scroll_pause) + scroll_time
+
+        # Pause at start / scroll forward / pause at end / scroll back, as clamped
+        # arithmetic: forward progress saturates at scroll_distance once the
+        # forward phase ends, and backward progress is zero until back_start
+        forward = (
+            max(t - self.scroll_pause, 0.0) * self.scroll_speed
+            if t < forward_end
+            else scroll_distance
+        )
+        back = max(t - back_start, 0.0) * self.scroll_speed
+        return int(forward - back)
 
-        if t < self.scroll_pause:
-            # Pause at start
-            return 0
-        elif t < self.scroll_pause + scroll_time:
-            # Scroll forward
-            elapsed = t - self.scroll_pause
-            return int(elapsed * self.scroll_speed)
-        elif t < (2 * self.scroll_pause) + scroll_time:
-            # Pause at end
-            return scroll_distance
-        else:
-            # Scroll back
-            elapsed = t - ((2 * self.scroll_pause) + scroll_time)
-            return int(scroll_distance - (elapsed * self.scroll_speed))
+    @property
+    def border_color(self) -> Tuple[int, int, int]:
+        return self._border_color
+
+    @border_color.setter
+    def border_color(self, border_color: Tuple[int, int, int]):
+        # Borders are baked into the full table buffer and cached viewports;
+        # bumping the version also marks the table changed for a parent Scene
+        self._border_color = border_color
+        self._border_rgb = np.array(border_color, dtype=np.uint8)
+        self._data_version += 1
+        self._clear_render_cache()
 
     @property
     def width(self) -> int:
@@ -351,7 +400,7 @@ class TableComponent(Component):
     def compute_state(self, time: float) -> dict:
         """Compute state - includes scroll offsets if scrolling is enabled."""
         state = {
-            "data": str(self.data),
+            "data_version": self._data_version,
             "headers": tuple(self.headers),
             "col_widths": tuple(self.col_widths),
         }
@@ -369,12 +418,15 @@ class TableComponent(Component):
 
         return state
 
-    @cache_with_dict(maxsize=128)
     def _render_cached(self, state: Dict[str, Any], time: float) -> RenderBuffer:
-        """Render table viewport (cached)."""
-        # Get full table buffer
-        full_buffer = self._render_full_table(time)
+        """
+        Render table viewport, cached by effective scroll position.
 
+        The viewport depends only on the clamped (scroll_x, scroll_y) pair - the
+        rest of the state is fixed until set_data() rebuilds the layout and
+        clears the cache - so a dict keyed on that int pair replaces
+        cache_with_dict's per-frame hashing of the whole state dict.
+        """
         # Determine effective scroll offsets (auto + manual)
         scroll_x = state.get("scroll_x", 0)
         scroll_y = state.get("scroll_y", 0)
@@ -388,42 +440,67 @@ class TableComponent(Component):
         # Clamp scroll offsets
         max_scroll_x = max(0, self._full_width - self._display_width)
         max_scroll_y = max(0, self._full_height - self._display_height)
-        scroll_x = max(0, min(scroll_x, max_scroll_x))
-        scroll_y = max(0, min(scroll_y, max_scroll_y))
+        key = (max(0, min(scroll_x, max_scroll_x)), max(0, min(scroll_y, max_scroll_y)))
+
+        # Scroll offsets change only on whole-pixel steps, so most frames land on
+        # the previous position - skip the dict lookup for those
+        if key == self._last_viewport_key:
+            return self._last_viewport
+
+        viewport = self._viewport_cache.get(key)
+        if viewport is None:
+            # Simple FIFO eviction when cache is full
+            if len(self._viewport_cache) >= self._VIEWPORT_CACHE_SIZE:
+                self._viewport_cache.pop(next(iter(self._viewport_cache)))
+            viewport = self._render_viewport(*key, time)
+            self._viewport_cache[key] = viewport
+
+        self._last_viewport_key = key
+        self._last_viewport = viewport
+        return viewport
+
+    def _render_viewport(self, scroll_x: int, scroll_y: int, time: float) -> RenderBuffer:
+        """Copy the visible portion of the full table at the given scroll offsets."""
+        full_pixels = self._full_pixels
+        if full_pixels is None:
+            full_pixels = self._render_full_table(time).data
 
         # Create viewport buffer
         viewport = RenderBuffer(self._display_width, self._display_height)
 
-        # Copy visible portion from full buffer
-        for y in range(self._display_height):
-            for x in range(self._display_width):
-                src_x = scroll_x + x
-                src_y = scroll_y + y
-                if 0 <= src_x < self._full_width and 0 <= src_y < self._full_height:
-                    pixel = full_buffer.get_pixel(src_x, src_y)
-                    viewport.set_pixel(x, y, pixel)
+        # Copy visible portion from full buffer as a single RGBA slice
+        copy_w = max(0, min(self._display_width, self._full_width - scroll_x))
+        copy_h = max(0, min(self._display_height, self._full_height - scroll_y))
+        viewport.data[:copy_h, :copy_w] = full_pixels[
+            scroll_y : scroll_y + copy_h, scroll_x : scroll_x + copy_w
+        ]
 
         return viewport
 
-    def _blit_buffer(self, dest: RenderBuffer, src: RenderBuffer, x_offset: int, y_offset: int):
-        """Blit source buffer onto destination buffer at offset."""
-        for y in range(src.height):
-            for x in range(src.width):
-                dest_x = x_offset + x
-                dest_y = y_offset + y
-
-                if 0 <= dest_x < dest.width and 0 <= dest_y < dest.height:
-                    pixel = src.get_pixel(x, y)
-                    dest.set_pixel(dest_x, dest_y, pixel)
-
-    def _draw_vertical_line(self, buffer: RenderBuffer, x: int, y_start: int, height: int):
-        """Draw a vertical border line."""
-        for y in range(y_start, y_start + height):
-            if 0 <= x < buffer.width and 0 <= y < buffer.height:
-                buffer.set_pixel(x, y, self.border_color)
-
-    def _draw_horizontal_line(self, buffer: RenderBuffer, y: int, width: int):
-        """Draw a horizontal border line."""
-        for x in range(width):
-            if 0 <= x < buffer.width and 0 <= y < buffer.height:
-                buffer.set_pixel(x, y, self.border_color)
+    def _blit_pixels(self, dest: RenderBuffer, src: np.ndarray, x_offset: int, y_offset: int):
+        """Copy source RGBA pixels (no blending) onto destination buffer at offset."""
+        src_height, src_width = src.shape[:2]
+
+        # Clip the source rectangle to the destination bounds
+        src_x_start = max(0, -x_offset)
+        src_y_start = max(0, -y_offset)
+        src_x_end = min(src_width, dest.width - x_offset)
+        src_y_end = min(src_height, dest.height - y_offset)
+
+        if src_x_start >= src_x_end or src_y_start >= src_y_end:
+            return
+
+        dest.data[
+            y_offset + src_y_start : y_offset + src_y_end,
+            x_offset + src_x_start : x_offset + src_x_end,
+        ] = src[src_y_start:src_y_end, src_x_start:src_x_end]
+
+    def _draw_borders(self, buffer: RenderBuffer):
+        """Draw all vertical and horizontal border lines in two slice fills."""
+        # Borders sit in the 1px gap just before each column/row offset
+        border_xs = self._col_x[1 : len(self.headers)] - 1
+        border_ys = self._row_y[1:] - 1
+
+        # RGB only - existing alpha is kept, as with set_pixel on a 3-tuple
+        buffer.data[:, border_xs[border_xs < buffer.width], :3] = self._border_rgb
+        buffer.data[border_ys[border_ys < buffer.height], :, :3] = self._border_rgb
@@ -1,12 +1,85 @@
 """Lightweight terminal emulator for RGB LED matrix displays."""
 
+import errno
+import os
+import queue
+import select
 import sys
 import logging
+import threading
 from collections import deque
+from itertools import groupby
+
+import numpy as np
+
 from .display_target import DisplayTarget
 from .render_buffer import RenderBuffer
 
 
+# Frames are assembled as UTF-8 bytes and written straight to the stdout fd
+_HOME = b'\x1b[H'
+_RESET_NEWLINE = b'\x1b[0m\n'
+_UPPER_HALF_BLOCK = '▀'.encode('utf-8')
+
+# ANSI SGR sequences keyed by packed 0xRRGGBB color - frames reuse few colors
+_FG_CODES: dict[int, bytes] = {}
+_BG_CODES: dict[int, bytes] = {}
+_MAX_CACHED_CODES = 65536
+
+
+def _color_code(codes: dict[int, bytes], layer: int, color: int) -> bytes:
+    """Format and cache the SGR sequence for a packed color (layer 38=fg, 48=bg)."""
+    if len(codes) >= _MAX_CACHED_CODES:
+        codes.clear()
+    code = f'\x1b[{layer};2;{color >> 16};{(color >> 8) & 0xFF};{color & 0xFF}m'.encode('ascii')
+    codes[color] = code
+    return code
+
+
+def _pack_rgb(rgb: np.ndarray) -> np.ndarray:
+    """Pack a (..., 3) uint8 RGB array into 0xRRGGBB integers."""
+    rgb = rgb.astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+def _row_runs(colors: np.ndarray) -> list[list[tuple[int, int]]]:
+    """
+    Split each row of a 2D color array into runs of identical adjacent values.
+
+    Run boundaries and lengths are found with NumPy, so Python only iterates
+    over runs. Returns one list of (color, length) pairs per row.
+    """
+    height, width = colors.shape
+    # A run starts at every column 0 and wherever the color changes
+    starts = np.ones((height, width), dtype=bool)
+    starts[:, 1:] = colors[:, 1:] != colors[:, :-1]
+    run_starts = np.flatnonzero(starts)
+
+    run_colors = colors.ravel()[run_starts].tolist()
+    run_lengths = np.diff(run_starts, append=height * width).tolist()
+    row_bounds = np.searchsorted(run_starts, np.arange(height + 1) * width).tolist()
+
+    return [
+        list(zip(run_colors[begin:end], run_lengths[begin:end]))
+        for begin, end in zip(row_bounds, row_bounds[1:])
+    ]
+
+
+def _flatten_alpha(buffer: RenderBuffer, width: int, height: int) -> np.ndarray:
+    """
+    Get buffer RGB as a (height, width, 3) uint8 array for terminal output.
+
+    Fully transparent pixels (alpha=0) become black, and pixels outside the
+    buffer are black - matching get_pixel()'s (0, 0, 0, 0) for out-of-range reads.
+    """
+    rgb = np.zeros((height, width, 3), dtype=np.uint8)
+    h = min(height, buffer.height)
+    w = min(width, buffer.width)
+    pixels = buffer.data[:h, :w]
+    rgb[:h, :w] = np.where(pixels[:, :, 3:4] == 0, 0, pixels[:, :, :3])
+    return rgb
+
+
 class LogCapture(logging.Handler):
     """Logging handler that captures the last N log messages."""
 
@@ -15,20 +88,46 @@ class LogCapture(logging.Handler):
         self.log_lines = deque(maxlen=maxlen)
         self.formatter = logging.Formatter('%(asctime)s.%(msecs)03d - %(name)s - %(message)s', datefmt='%H:%M:%S')
 
+        # Encoded, width-fitted lines - rebuilt only after a new record or width change
+        self._block_width = None
+        self._block = b''
+
     def emit(self, record):
         try:
             msg = self.format(record)
             self.log_lines.append(msg)
+            self._block_width = None
         except Exception:
             self.handleError(record)
 
+    def padded_block(self, width: int) -> bytes:
+        """Get the captured lines truncated or padded to width, one per line, as UTF-8."""
+        self.acquire()
+        try:
+            if self._block_width != width:
+                lines = []
+                for log_line in self.log_lines:
+                    # Truncate or pad to terminal width
+                    if len(log_line) > width:
+                        log_line = log_line[:width]
+                    else:
+                        log_line += ' ' * (width - len(log_line))
+                    lines.append(log_line.encode('utf-8', 'replace'))
+                    lines.append(b'\n')
+                self._block = b''.join(lines)
+                self._block_width = width
+            return self._block
+        finally:
+            self.release()
+
 
 class TerminalDisplayTarget(DisplayTarget):
     """
     Lightweight terminal-based display target using ANSI escape codes.
 
     Uses alternate screen buffer and double-buffering for flicker-free
-    rendering at 30-60 FPS.
+    rendering at 30-60 FPS. Frames are written by a background thread so
+    terminal I/O overlaps with rendering the next frame.
     """
 
     def __init__(self, width: int, height: int, use_half_blocks: bool = False, square_pixels: bool = True, show_logs: bool = True, log_lines: int = 10):
@@ -52,6 +151,12 @@ class TerminalDisplayTarget(DisplayTarget):
         self.show_logs = show_logs
         self.log_lines_count = log_lines
         self._initialized = False
+        self._fd = None  # stdout file descriptor, set by initialize()
+
+        # Background writer: holds at most one pending frame, started by initialize()
+        self._frame_queue: queue.Queue | None = None
+        self._writer_thread: threading.Thread | None = None
+        self._writer_error: Exception | None = None
 
         # Setup log capture if requested
         self.log_capture = None
@@ -78,6 +183,19 @@ class TerminalDisplayTarget(DisplayTarget):
         sys.stdout.write('\x1b[2J')
         sys.stdout.flush()
 
+        # Frames bypass the text layer when stdout is a real file descriptor
+        try:
+            self._fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._fd = None
+
+        self._writer_error = None
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="TerminalDisplayWriter", daemon=True
+        )
+        self._writer_thread.start()
+
         self._initialized = True
 
     def display(self, buffer: RenderBuffer):
@@ -92,7 +210,7 @@ class TerminalDisplayTarget(DisplayTarget):
 
         frame = []
         # Move cursor to home position
-        frame.append('\x1b[H')
+        frame.append(_HOME)
 
         if self.use_half_blocks:
             self._render_half_blocks(buffer, frame)
@@ -104,10 +222,82 @@ class TerminalDisplayTarget(DisplayTarget):
             self._render_log_section(frame)
 
         # Single write for entire frame (reduces flicker)
-        sys.stdout.write(''.join(frame))
-        sys.stdout.flush()
+        payload = b''.join(frame)
+
+        # Frames bypass sys.stdout's buffer, so push out any text printed
+        # through it first to keep the two in order
+        if self._fd is not None:
+            sys.stdout.flush()
+
+        if self._frame_queue is None:
+            self._write(payload)
+            return
+
+        if self._writer_error is not None:
+            raise self._writer_error
 
-    def _render_full_blocks(self, buffer: RenderBuffer, frame: list):
+        # Hand off to the writer thread; if it is still busy with an older
+        # frame that has not been started, replace it to stay realtime
+        try:
+            self._frame_queue.put_nowait(payload)
+        except queue.Full:
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_queue.put_nowait(payload)
+
+    def _writer_loop(self):
+        """Write queued frames until the None sentinel is received."""
+        while True:
+            payload = self._frame_queue.get()
+            if payload is None:
+                return
+            try:
+                self._write(payload)
+            except Exception as e:
+                # Surfaced by the next display() call
+                self._writer_error = e
+                return
+
+    def _stop_writer(self):
+        """Let the writer thread finish pending frames, then join it."""
+        writer = self._writer_thread
+        if writer is None:
+            return
+
+        while writer.is_alive():
+            try:
+                self._frame_queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        writer.join()
+
+        self._frame_queue = None
+        self._writer_thread = None
+
+    def _write(self, payload: bytes):
+        """Write a frame to stdout, via os.write when a file descriptor is available."""
+        if self._fd is None:
+            sys.stdout.write(payload.decode('utf-8'))
+            sys.stdout.flush()
+            return
+
+        # os.write may write only part of a large frame - loop until all is out
+        view = memoryview(payload)
+        while view:
+            try:
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                # Non-blocking fd with a full terminal buffer - wait until it drains
+                select.select((), (self._fd,), ())
+                continue
+            if not written:
+                raise OSError(errno.EIO, "Terminal accepted no bytes of the frame")
+            view = view[written:]
+
+    def _render_full_blocks(self, buffer: RenderBuffer, frame: list[bytes]):
         """
         Render using full block characters (█).
         Each terminal character represents one LED pixel.
@@ -115,20 +305,22 @@ class TerminalDisplayTarget(DisplayTarget):
         everything else shows its color.
         """
         chars_per_pixel = 2 if self.square_pixels else 1
+        pixel = b' ' * chars_per_pixel
+
+        bg_codes = _BG_CODES
+        colors = _pack_rgb(_flatten_alpha(buffer, self.width, self.height))
 
-        for y in range(self.height):
-            for x in range(self.width):
-                r, g, b, a = buffer.get_pixel(x, y)
-                # Flatten alpha: if fully transparent, show black; otherwise show color
-                if a == 0:
-                    r, g, b = 0, 0, 0
+        # Emit each row's background color once per run of identical adjacent pixels
+        for row in _row_runs(colors):
+            for color, length in row:
+                code = bg_codes.get(color) or _color_code(bg_codes, 48, color)
                 # Use background color and render multiple spaces for square pixels
-                frame.append(f'\x1b[48;2;{r};{g};{b}m')
-                frame.append(' ' * chars_per_pixel)
+                frame.append(code)
+                frame.append(pixel * length)
             # Reset colors and newline
-            frame.append('\x1b[0m\n')
+            frame.append(_RESET_NEWLINE)
 
-    def _render_half_blocks(self, buffer: RenderBuffer, frame: list):
+    def _render_half_blocks(self, buffer: RenderBuffer, frame: list[bytes]):
         """
         Render using Unicode half-blocks (▀/▄).
         This doubles the vertical resolution by using foreground + background colors.
@@ -136,49 +328,52 @@ class TerminalDisplayTarget(DisplayTarget):
         Alpha channel is flattened: fully transparent (alpha=0) shows as black,
         everything else shows its color.
         """
-        # Process two rows at a time
-        for y in range(0, self.height, 2):
-            for x in range(self.width):
-                r1, g1, b1, a1 = buffer.get_pixel(x, y)
-                # Flatten alpha for top pixel
-                if a1 == 0:
-                    r1, g1, b1 = 0, 0, 0
-
-                # Check if there's a second row
-                if y + 1 < self.height:
-                    r2, g2, b2, a2 = buffer.get_pixel(x, y + 1)
-                    # Flatten alpha for bottom pixel
-                    if a2 == 0:
-                        r2, g2, b2 = 0, 0, 0
-                    # Upper half block: foreground is top pixel, background is bottom pixel
-                    frame.append(f'\x1b[38;2;{r1};{g1};{b1}m\x1b[48;2;{r2};{g2};{b2}m▀')
-                else:
-                    # Last row (odd height) - just show top pixel
-                    frame.append(f'\x1b[38;2;{r1};{g1};{b1}m▀')
+        fg_codes = _FG_CODES
+        bg_codes = _BG_CODES
+        colors = _pack_rgb(_flatten_alpha(buffer, self.width, self.height))
+        # Pre-slice even (top) and odd (bottom) pixel rows of each terminal line
+        top_rows = colors[0::2].tolist()
+        bottom_rows = colors[1::2].tolist()
 
+        # Process two rows at a time
+        for top, bottom in zip(top_rows, bottom_rows):
+            # Terminal colors persist until changed (each line starts after a reset),
+            # so only the side that differs from the previous run is re-emitted
+            cur_fg = cur_bg = None
+            # Emit the colors once per run of identical (top, bottom) pixel pairs
+            for (top_color, bottom_color), run in groupby(zip(top, bottom)):
+                # Upper half block: foreground is top pixel, background is bottom pixel
+                if top_color != cur_fg:
+                    frame.append(fg_codes.get(top_color) or _color_code(fg_codes, 38, top_color))
+                    cur_fg = top_color
+                if bottom_color != cur_bg:
+                    frame.append(
+                        bg_codes.get(bottom_color) or _color_code(bg_codes, 48, bottom_color)
+                    )
+                    cur_bg = bottom_color
+                frame.append(_UPPER_HALF_BLOCK * sum(1 for _ in run))
             # Reset colors and newline
-            frame.append('\x1b[0m\n')
+            frame.append(_RESET_NEWLINE)
+
+        # Last row (odd height) - just show top pixel
+        if len(top_rows) > len(bottom_rows):
+            for top_color, run in groupby(top_rows[-1]):
+                frame.append(fg_codes.get(top_color) or _color_code(fg_codes, 38, top_color))
+                frame.append(_UPPER_HALF_BLOCK * sum(1 for _ in run))
+            frame.append(_RESET_NEWLINE)
 
-    def _render_log_section(self, frame: list):
+    def _render_log_section(self, frame: list[bytes]):
         """Render the log section below the matrix display."""
         # Reset colors and add blank line
-        frame.append('\x1b[0m')
-        frame.append('\n')
+        frame.append(_RESET_NEWLINE)
 
         # Calculate terminal width (matrix width * chars per pixel)
         chars_per_pixel = 2 if self.square_pixels else 1
         terminal_width = self.width * chars_per_pixel
 
         # Add log lines with clearing to full width
-        if self.log_capture and self.log_capture.log_lines:
-            for log_line in self.log_capture.log_lines:
-                # Truncate or pad to terminal width
-                if len(log_line) > terminal_width:
-                    frame.append(log_line[:terminal_width])
-                else:
-                    frame.append(log_line)
-                    frame.append(' ' * (terminal_width - len(log_line)))
-                frame.append('\n')
+        if self.log_capture:
+            frame.append(self.log_capture.padded_block(terminal_width))
 
     def shutdown(self):
         """Clean up terminal display (show cursor, exit alternate screen)."""
@@ -189,6 +384,9 @@ class TerminalDisplayTarget(DisplayTarget):
         if self.log_capture:
             logging.getLogger().removeHandler(self.log_capture)
 
+        # Flush the last frame before restoring the terminal
+        self._stop_writer()
+
         # Show cursor
         sys.stdout.write('\x1b[?25h')
         # Exit alternate screen buffer
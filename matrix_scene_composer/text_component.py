@@ -1,6 +1,7 @@
 """Ultra-compact bitmap text component for LED matrix displays."""
 
-from typing import Literal, Tuple
+import itertools
+from typing import Dict, List, Literal, Tuple
 
 import numpy as np
 
@@ -14,6 +15,31 @@ FONT_MAP = {
     5: BITMAP_FONT_5PX,
 }
 
+# Render state versions are unique across instances, so a Scene that swaps one
+# TextComponent for another under the same child id never gets a stale cache hit
+_STATE_VERSIONS = itertools.count(1)
+
+# Boolean copies of each font's glyphs, built on first use per height: a
+# 128-entry table indexed by ord(char) for ASCII, plus a dict for the few
+# non-ASCII glyphs (e.g. arrows). Missing characters map to a space.
+_GLYPH_TABLES: Dict[int, Tuple[List[np.ndarray], Dict[str, np.ndarray]]] = {}
+
+
+def _glyph_table(font_height: int) -> Tuple[List[np.ndarray], Dict[str, np.ndarray]]:
+    """Get the ASCII glyph mask table and non-ASCII glyph masks for font_height."""
+    tables = _GLYPH_TABLES.get(font_height)
+    if tables is None:
+        font = FONT_MAP[font_height]
+        ascii_table = [font[" "] != 0] * 128
+        extra = {}
+        for char, bitmap in font.items():
+            if ord(char) < 128:
+                ascii_table[ord(char)] = bitmap != 0
+            else:
+                extra[char] = bitmap != 0
+        tables = _GLYPH_TABLES[font_height] = (ascii_table, extra)
+    return tables
+
 
 class TextComponent(Component):
     """
@@ -29,6 +55,9 @@ class TextComponent(Component):
     - Automatic horizontal scrolling if text wider than max_width
     """
 
+    # render() has no side effects, so a Scene may skip it while offscreen
+    render_offscreen_skippable = True
+
     def __init__(
         self,
         text: str,
@@ -66,12 +95,13 @@ class TextComponent(Component):
                 f"Font height {font_height}px not supported. " f"Available heights: {available}"
             )
 
-        self.text = text.upper()
+        self._text = text.upper()
         self.font_height = font_height
         self.font = FONT_MAP[font_height]
-        self.fgcolor = fgcolor
-        self.bgcolor = bgcolor
-        self.padding = padding
+        self._fgcolor = fgcolor
+        self._bgcolor = bgcolor
+        self._fg_rgba, self._bg_rgba = self._rgba_colors()
+        self._padding = padding
         self.max_width = max_width
         self.scroll_speed = scroll_speed
         self.scroll_pause = scroll_pause
@@ -79,63 +109,104 @@ class TextComponent(Component):
         # Calculate letter spacing: 1px for smaller fonts (4-7px), 2px for larger (8-16px)
         self.letter_spacing = 1 if font_height < 8 else 2
 
+        self.autoscroll = autoscroll
+        self._autoscroll_enabled = True  # Can be toggled at runtime
+        self.scroll_offset_x = 0  # Manual scroll offset
+
+        self._layout(preserve_scroll=False)
+
+    def _layout(self, preserve_scroll: bool):
+        """
+        Recompute dimensions, pre-rendered text and render state after the text
+        or padding changes.
+
+        Args:
+            preserve_scroll: If True, keep the manual scroll offset (clamped to
+                the new text width) instead of resetting it to 0
+        """
+        old_scroll = self.scroll_offset_x if preserve_scroll else 0
+
         # Pre-compute text dimensions (without container constraint)
+        self._precompute_text_layout()
         text_width, text_height = self._compute_text_dimensions()
         self._text_width = text_width
         self._text_height = text_height
 
-        self.autoscroll = autoscroll
-        self._autoscroll_enabled = True  # Can be toggled at runtime
-        self.scroll_offset_x = 0  # Manual scroll offset
-        # determine if scrolling is needed
+        # Determine if scrolling is needed
         self._needs_scroll = (
-            autoscroll == "X" and max_width is not None and (text_width + 2 * padding) > max_width
+            self.autoscroll == "X"
+            and self.max_width is not None
+            and (text_width + 2 * self._padding) > self.max_width
         )
 
         # Set component dimensions
-        if max_width is not None:
-            self._width = max_width
+        if self.max_width is not None:
+            self._width = self.max_width
         else:
-            self._width = text_width + (2 * padding)
-        self._height = text_height + (2 * padding)
+            self._width = text_width + (2 * self._padding)
+        self._height = text_height + (2 * self._padding)
 
-        # Pre-render full text buffer (reused during scrolling)
-        self._full_text_buffer = self._render_full_text()
+        # Pre-render glyph mask, plus the full text buffer if it will scroll (static
+        # text renders straight from the mask)
+        self._text_mask = self._render_text_mask()
+        self._full_text = self._render_full_text() if self._needs_scroll else None
+
+        # Render state reused across frames (see compute_state)
+        self._reset_state_cache()
+        self._scroll_schedule = self._compute_scroll_schedule()
+
+        # Restore or clamp scroll position
+        if preserve_scroll and self._needs_scroll:
+            available_width = self._width - (2 * self._padding)
+            max_scroll = max(0, self._text_width - available_width)
+            self.scroll_offset_x = min(old_scroll, max_scroll)
+        else:
+            self.scroll_offset_x = 0
+
+    def _precompute_text_layout(self):
+        """Resolve each character's bitmap and x position once per text change."""
+        ascii_table, extra = _glyph_table(self.font_height)
+        space = ascii_table[ord(" ")]
+        # Unsupported characters render as a space
+        self._char_bitmaps = [
+            ascii_table[ord(char)] if char < "\x80" else extra.get(char, space)
+            for char in self.text
+        ]
+        self._char_widths = np.array(
+            [bitmap.shape[1] for bitmap in self._char_bitmaps], dtype=np.intp
+        )
+        # Each letter starts after the previous letters plus their spacing
+        self._char_x = np.zeros(len(self._char_widths), dtype=np.intp)
+        self._char_x[1:] = np.cumsum(self._char_widths[:-1] + self.letter_spacing)
 
     def _compute_text_dimensions(self) -> Tuple[int, int]:
         """Compute total width and height needed for text."""
         if not self.text:
             return (0, 0)
 
-        total_width = 0
-        for i, char in enumerate(self.text):
-            if char in self.font:
-                letter_width = self.font[char].shape[1]
-                total_width += letter_width
-                if i < len(self.text) - 1:
-                    total_width += self.letter_spacing
-            else:
-                total_width += self.font[" "].shape[1]
-                if i < len(self.text) - 1:
-                    total_width += self.letter_spacing
+        return (int(self._char_x[-1] + self._char_widths[-1]), self.font_height)
 
-        return (total_width, self.font_height)
+    def _render_text_mask(self) -> np.ndarray:
+        """Combine all glyph bitmaps into one boolean mask of the text's lit pixels."""
+        mask = np.zeros((self._text_height, self._text_width), dtype=bool)
 
-    def _render_full_text(self) -> RenderBuffer:
-        """Render complete text to buffer (used for scrolling)."""
-        buffer = RenderBuffer(self._text_width, self._text_height)
+        for letter_bitmap, x_offset in zip(self._char_bitmaps, self._char_x.tolist()):
+            rows, cols = letter_bitmap.shape
+            mask[:rows, x_offset : x_offset + cols] |= letter_bitmap
 
-        if not self.text:
-            return buffer
+        return mask
 
-        x_offset = 0
-        for i, char in enumerate(self.text):
-            letter_bitmap = self.font.get(char, self.font[" "])
-            self._blit_bitmap(buffer, letter_bitmap, x_offset, 0, self.fgcolor)
-            x_offset += letter_bitmap.shape[1]
-            if i < len(self.text) - 1:
-                x_offset += self.letter_spacing
+    @property
+    def _full_text_buffer(self) -> RenderBuffer:
+        """Pre-colored full text strip used for scrolling, rendered on first use."""
+        if self._full_text is None:
+            self._full_text = self._render_full_text()
+        return self._full_text
 
+    def _render_full_text(self) -> RenderBuffer:
+        """Render complete text to buffer (used for scrolling)."""
+        buffer = RenderBuffer(self._text_width, self._text_height)
+        buffer.data[self._text_mask, :3] = self.fgcolor
         return buffer
 
     @property
@@ -146,33 +217,87 @@ class TextComponent(Component):
     def height(self) -> int:
         return self._height
 
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, text: str):
+        self.set_text(text)
+
+    @property
+    def padding(self) -> int:
+        return self._padding
+
+    @padding.setter
+    def padding(self, padding: int):
+        self._padding = padding
+        self._layout(preserve_scroll=True)
+
+    @property
+    def fgcolor(self) -> Tuple[int, int, int]:
+        return self._fgcolor
+
+    @fgcolor.setter
+    def fgcolor(self, color: Tuple[int, int, int]):
+        self._fgcolor = color
+        self._fg_rgba, self._bg_rgba = self._rgba_colors()
+        self._full_text = self._render_full_text() if self._needs_scroll else None
+        self._reset_state_cache()
+
+    @property
+    def bgcolor(self) -> Tuple[int, int, int] | None:
+        return self._bgcolor
+
+    @bgcolor.setter
+    def bgcolor(self, color: Tuple[int, int, int] | None):
+        self._bgcolor = color
+        self._fg_rgba, self._bg_rgba = self._rgba_colors()
+        self._reset_state_cache()
+
+    def _rgba_colors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Opaque RGBA pixel values for the text and background (black if no bgcolor)."""
+        bgcolor = self._bgcolor if self._bgcolor is not None else (0, 0, 0)
+        return (
+            np.array((*self._fgcolor, 255), dtype=np.uint8),
+            np.array((*bgcolor, 255), dtype=np.uint8),
+        )
+
+    def _reset_state_cache(self):
+        """
+        Start a new state version after text/style changes.
+
+        The render state is just this counter (plus the scroll offset when
+        scrolling), so per-frame cache lookups hash a small int instead of the
+        full text string.
+        """
+        self._state_version = next(_STATE_VERSIONS)
+        self._static_state = {"v": self._state_version}
+        self._scroll_state = None
+
     def compute_state(self, time: float) -> dict:
-        """Compute state - includes scroll offset if scrolling is enabled."""
+        """
+        Compute state - includes scroll offset if scrolling is enabled.
+
+        The same dict object is returned for as long as the state is unchanged,
+        so static labels allocate nothing per frame. Callers must not mutate it.
+        """
         if not self._needs_scroll:
-            return {
-                "text": self.text,
-                "font_height": self.font_height,
-                "fgcolor": self.fgcolor,
-                "bgcolor": self.bgcolor,
-                "padding": self.padding,
-            }
+            return self._static_state
 
         # Calculate scroll position
         if self.autoscroll == "X" and self._autoscroll_enabled:
             # Use time-based autoscroll
-            scroll_offset = self._calculate_scroll_offset(time)
+            scroll_offset = int(self._calculate_scroll_offset(time))
         else:
             # Use manual scroll offset
-            scroll_offset = self.scroll_offset_x
+            scroll_offset = int(self.scroll_offset_x)
 
-        return {
-            "text": self.text,
-            "font_height": self.font_height,
-            "fgcolor": self.fgcolor,
-            "bgcolor": self.bgcolor,
-            "padding": self.padding,
-            "scroll_offset": int(scroll_offset),
-        }
+        state = self._scroll_state
+        if state is None or state["scroll"] != scroll_offset:
+            state = {"v": self._state_version, "scroll": scroll_offset}
+            self._scroll_state = state
+        return state
 
     def scroll_to(self, x: int = 0):
         """Set horizontal scroll position."""
@@ -200,8 +325,13 @@ class TextComponent(Component):
         """Text component is focusable if it can scroll."""
         return self._needs_scroll
 
-    def _calculate_scroll_offset(self, time: float) -> int:
-        """Calculate horizontal scroll offset for given time."""
+    def _compute_scroll_schedule(self) -> Tuple[int, float, float, float] | None:
+        """
+        Precompute the autoscroll cycle for the current text and size.
+
+        Returns (scroll_distance, forward_end, back_start, cycle_time), or None if
+        the text fits and never scrolls.
+        """
         # Available width for text (excluding padding)
         available_width = self._width - (2 * self.padding)
 
@@ -209,70 +339,82 @@ class TextComponent(Component):
         scroll_distance = self._text_width - available_width
 
         if scroll_distance <= 0:
-            return 0
+            return None
 
         # Total cycle time: pause + scroll right + pause + scroll left
         scroll_time = scroll_distance / self.scroll_speed
         cycle_time = (2 * self.scroll_pause) + (2 * scroll_time)
+        forward_end = self.scroll_pause + scroll_time
+        back_start = (2 * self.scroll_pause) + scroll_time
+        return scroll_distance, forward_end, back_start, cycle_time
+
+    def _calculate_scroll_offset(self, time: float) -> int:
+        """Calculate horizontal scroll offset for given time."""
+        if self._scroll_schedule is None:
+            return 0
+        scroll_distance, forward_end, back_start, cycle_time = self._scroll_schedule
 
         # Position within current cycle
         t = time % cycle_time
 
-        if t < self.scroll_pause:
-            # Pause at start
-            return 0
-        elif t < self.scroll_pause + scroll_time:
-            # Scroll right
-            elapsed = t - self.scroll_pause
-            return int(elapsed * self.scroll_speed)
-        elif t < (2 * self.scroll_pause) + scroll_time:
-            # Pause at end
-            return scroll_distance
-        else:
-            # Scroll left
-            elapsed = t - ((2 * self.scroll_pause) + scroll_time)
-            return int(scroll_distance - (elapsed * self.scroll_speed))
+        # Pause at start / scroll right / pause at end / scroll left, as clamped
+        # arithmetic: forward progress saturates at scroll_distance once the
+        # forward phase ends, and backward progress is zero until back_start
+        forward = (
+            max(t - self.scroll_pause, 0.0) * self.scroll_speed
+            if t < forward_end
+            else scroll_distance
+        )
+        back = max(t - back_start, 0.0) * self.scroll_speed
+        return int(forward - back)
 
     @cache_with_dict(maxsize=128)
     def _render_cached(self, state: dict, time: float) -> RenderBuffer:
         """Cached rendering of text with optional scrolling."""
-        buffer = RenderBuffer(self._width, self._height)
-
-        # Fill background if bgcolor is specified
-        if self.bgcolor is not None:
-            for y in range(self._height):
-                for x in range(self._width):
-                    buffer.set_pixel(x, y, self.bgcolor)
-
         if not self.text:
-            return buffer
+            return RenderBuffer.filled(self._width, self._height, self._bg_rgba)
+        if self._needs_scroll:
+            return self._render_scrolled(state["scroll"])
+        return self._render_static()
 
-        if not self._needs_scroll:
-            # No scrolling - render text directly at padding offset
-            x_offset = self.padding
-            for i, char in enumerate(self.text):
-                letter_bitmap = self.font.get(char, self.font[" "])
-                self._blit_bitmap(buffer, letter_bitmap, x_offset, self.padding, self.fgcolor)
-                x_offset += letter_bitmap.shape[1]
-                if i < len(self.text) - 1:
-                    x_offset += self.letter_spacing
-        else:
-            # Scrolling - blit portion of pre-rendered text buffer
-            scroll_offset = state["scroll_offset"]
-            available_width = self._width - (2 * self.padding)
-
-            # Copy visible portion from full text buffer
-            for y in range(self._text_height):
-                for x in range(available_width):
-                    src_x = scroll_offset + x
-                    if 0 <= src_x < self._text_width:
-                        pixel = self._full_text_buffer.get_pixel(src_x, y)
-                        dest_x = self.padding + x
-                        dest_y = self.padding + y
-                        if pixel[3] > 0:  # Only copy non-transparent pixels
-                            buffer.set_pixel(dest_x, dest_y, pixel)
+    def _render_static(self) -> RenderBuffer:
+        """
+        Compose background and lit glyph pixels in a single pass, placing the
+        text mask at the padding offset (clipped if the text is wider than the
+        component).
+        """
+        rows = max(0, min(self._text_height, self._height - self.padding))
+        cols = max(0, min(self._text_width, self._width - self.padding))
+        mask = np.zeros((self._height, self._width), dtype=bool)
+        mask[self.padding : self.padding + rows, self.padding : self.padding + cols] = (
+            self._text_mask[:rows, :cols]
+        )
+        pixels = np.where(mask[:, :, np.newaxis], self._fg_rgba, self._bg_rgba)
+        return RenderBuffer.from_array(pixels)
 
-        return buffer
+    def _render_scrolled(self, scroll_offset: int) -> RenderBuffer:
+        """
+        Copy the visible columns of the pre-rendered (opaque) text strip as one
+        slice, clamped to the text's columns. The buffer starts uninitialized and
+        only the pixels outside that window get the background, so every pixel is
+        written exactly once.
+        """
+        bg_rgba = self._bg_rgba
+        available_width = self._width - (2 * self.padding)
+        src_x0 = max(0, scroll_offset)
+        src_x1 = min(self._text_width, scroll_offset + available_width)
+        dest_x0 = self.padding + (src_x0 - scroll_offset)
+        dest_x1 = max(dest_x0, dest_x0 + (src_x1 - src_x0))
+        top, bottom = self.padding, self.padding + self._text_height
+
+        pixels = np.empty((self._height, self._width, 4), dtype=np.uint8)
+        pixels[:top] = bg_rgba
+        pixels[bottom:] = bg_rgba
+        pixels[top:bottom, :dest_x0] = bg_rgba
+        pixels[top:bottom, dest_x1:] = bg_rgba
+        if src_x0 < src_x1:
+            pixels[top:bottom, dest_x0:dest_x1] = self._full_text_buffer.data[:, src_x0:src_x1]
+        return RenderBuffer.from_array(pixels)
 
     def set_text(self, text: str, preserve_scroll: bool = True):
         """
@@ -282,56 +424,5 @@ class TextComponent(Component):
             text: New text to display
             preserve_scroll: If True, maintains current scroll position
         """
-        old_scroll = self.scroll_offset_x if preserve_scroll else 0
-
-        self.text = text.upper()
-
-        # Recalculate dimensions
-        text_width, text_height = self._compute_text_dimensions()
-        self._text_width = text_width
-        self._text_height = text_height
-
-        # Determine if scrolling is needed
-        self._needs_scroll = (
-            self.autoscroll == "X"
-            and self.max_width is not None
-            and (text_width + 2 * self.padding) > self.max_width
-        )
-
-        # Update component dimensions
-        if self.max_width is not None:
-            self._width = self.max_width
-        else:
-            self._width = text_width + (2 * self.padding)
-        self._height = text_height + (2 * self.padding)
-
-        # Re-render full text buffer
-        self._full_text_buffer = self._render_full_text()
-
-        # Restore or clamp scroll position
-        if preserve_scroll and self._needs_scroll:
-            available_width = self._width - (2 * self.padding)
-            max_scroll = max(0, self._text_width - available_width)
-            self.scroll_offset_x = min(old_scroll, max_scroll)
-        else:
-            self.scroll_offset_x = 0
-
-    def _blit_bitmap(
-        self,
-        buffer: RenderBuffer,
-        bitmap_array: np.ndarray,
-        x_offset: int,
-        y_offset: int,
-        color: Tuple[int, int, int],
-    ):
-        """Blit bitmap array onto render buffer with color."""
-        rows, cols = bitmap_array.shape
-
-        for row in range(rows):
-            for col in range(cols):
-                if bitmap_array[row, col]:
-                    x = x_offset + col
-                    y = y_offset + row
-
-                    if 0 <= x < buffer.width and 0 <= y < buffer.height:
-                        buffer.set_pixel(x, y, color)
+        self._text = text.upper()
+        self._layout(preserve_scroll)
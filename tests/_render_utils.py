@@ -0,0 +1,59 @@
+"""Terminal preview helpers shared by the test scripts."""
+
+import sys
+
+import numpy as np
+
+
+# Clear screen and move cursor to top-left
+CLEAR_SCREEN = '\033[2J\033[H'
+
+# 256-color mode cells by palette index (only the 6x6x6 color cube, 16-231, is used)
+ANSI_256_CELLS = [f'\033[38;5;{index}m█\033[0m' for index in range(256)]
+
+
+def render_to_terminal(buffer, flatten_alpha=False, clear=False, palette=False):
+    """
+    Render buffer to terminal with ANSI colors, one write per frame.
+
+    Args:
+        buffer: RenderBuffer instance
+        flatten_alpha: Show fully transparent pixels as black
+        clear: Clear the screen first (in the same write), for animated output
+        palette: Approximate colors with the 256-color palette instead of true
+            color - roughly half the output size, for quick reviews
+    """
+    rgb = buffer.data[:, :, :3]
+    if flatten_alpha:
+        rgb = np.where(buffer.data[:, :, 3:4] == 0, 0, rgb)
+
+    if palette:
+        # Nearest level (0-5) per channel, then index into the color cube
+        levels = (rgb.astype(np.uint16) * 5 + 127) // 255
+        index = 16 + 36 * levels[:, :, 0] + 6 * levels[:, :, 1] + levels[:, :, 2]
+        lines = [''.join(map(ANSI_256_CELLS.__getitem__, row)) for row in index.tolist()]
+    else:
+        # Format each distinct color once, then assemble rows by lookup
+        pixels = rgb.astype(np.uint32)
+        packed = (pixels[:, :, 0] << 16) | (pixels[:, :, 1] << 8) | pixels[:, :, 2]
+        cells = {
+            color: f'\033[38;2;{color >> 16};{(color >> 8) & 255};{color & 255}m█\033[0m'
+            for color in np.unique(packed).tolist()
+        }
+        lines = [''.join(map(cells.__getitem__, row)) for row in packed.tolist()]
+    sys.stdout.write((CLEAR_SCREEN if clear else '') + ''.join(line + '\n' for line in lines))
+
+
+def visualize_buffer(buffer, scale=1):
+    """
+    Visualize a RenderBuffer as ASCII art in the terminal.
+
+    Args:
+        buffer: RenderBuffer instance
+        scale: Integer scaling factor (1 = normal, 2 = 2x size, etc.)
+    """
+    # Simple thresholding: if any color component > 128, show as filled.
+    # Horizontal scaling repeats columns; vertical scaling repeats lines.
+    lit = np.repeat(buffer.data[:, :, :3].max(axis=2) > 128, scale, axis=1)
+    rows = [''.join(['█' if filled else ' ' for filled in row]) for row in lit.tolist()]
+    return '\n'.join([line for line in rows for _ in range(scale)])
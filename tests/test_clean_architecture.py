@@ -34,12 +34,7 @@ class SimpleComponent(Component):
 
     def _render_cached(self, state, time):
         # Component renders itself, time is passed in
-        buffer = RenderBuffer(self.width, self.height)
-        color = state["color"]
-        for y in range(self.height):
-            for x in range(self.width):
-                buffer.set_pixel(x, y, color)
-        return buffer
+        return RenderBuffer.filled(self.width, self.height, state["color"])
 
 
 class AnimatedComponent(Component):
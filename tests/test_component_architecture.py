@@ -53,12 +53,8 @@ class SimpleComponent(Component):
     def _render_cached(self, state: dict, time: float) -> RenderBuffer:
         """Render from state - time passed separately."""
         self.render_call_count += 1
-        buffer = RenderBuffer(self.width, self.height)
         # Fill with white pixels
-        for y in range(self.height):
-            for x in range(self.width):
-                buffer.set_pixel(x, y, (255, 255, 255))
-        return buffer
+        return RenderBuffer.filled(self.width, self.height, (255, 255, 255))
 
 
 def test_component_rendered_at_tracking():
@@ -171,7 +167,7 @@ def test_scene_cache_invalidation_on_position_change():
     assert scene._rendered_at == scene_rendered_at_1, "Scene timestamp shouldn't change if state unchanged"
 
     # Now actually modify child position in children dict (simulating animation)
-    scene.children["comp1"].state['position'] = (10, 0)
+    scene.children["comp1"].state['x'] = 10
 
     # Render with new position → cache should MISS, timestamp should update
     scene_buffer3 = scene.render(3.0)
@@ -39,12 +39,8 @@ class SimpleComponent(Component):
     def _render_cached(self, state, time: float) -> RenderBuffer:
         """This should only be called on cache misses."""
         self.render_count += 1
-        buffer = RenderBuffer(self.width, self.height)
         # Just fill with white to show it rendered
-        for y in range(self.height):
-            for x in range(self.width):
-                buffer.set_pixel(x, y, (255, 255, 255))
-        return buffer
+        return RenderBuffer.filled(self.width, self.height, (255, 255, 255))
 
 
 def test_cache_hit():
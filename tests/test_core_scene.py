@@ -20,6 +20,8 @@ from matrix_scene_composer.component import cache_with_dict
 class ColorComponent(Component):
     """Simple component that fills with a solid color."""
 
+    render_offscreen_skippable = True
+
     def __init__(self, width: int, height: int, color: tuple):
         super().__init__()
         self._width = width
@@ -116,6 +118,26 @@ def test_z_index_layering():
     print("✓ Higher z-index renders on top in overlap regions")
 
 
+def test_z_index_change():
+    """Test that changing a child's z_index after adding it updates render order."""
+    print("\n=== Test: Z-Index Change ===")
+
+    scene = Scene(width=64, height=32)
+    scene.add_child('red', ColorComponent(10, 10, (255, 0, 0)), position=(5, 5), z_index=1)
+    scene.add_child('blue', ColorComponent(10, 10, (0, 0, 255)), position=(10, 10), z_index=2)
+
+    assert scene.render(0.0).get_pixel(12, 12) == (0, 0, 255, 255), "Blue should start on top"
+
+    scene.set_child_z_index('red', 3)
+    assert scene.render(0.0).get_pixel(12, 12) == (255, 0, 0, 255), "Red should now be on top"
+
+    # Direct state edits (e.g. from animations) are picked up too
+    scene.children['blue'].state['z_index'] = 4
+    assert scene.render(0.0).get_pixel(12, 12) == (0, 0, 255, 255), "Blue should be back on top"
+
+    print("✓ Render order follows z_index changes")
+
+
 def test_add_remove_component():
     """Test adding and removing components from scene."""
     print("\n=== Test: Add/Remove Component ===")
@@ -213,12 +235,103 @@ def test_multiple_components():
     print("✓ Each component maintains independent position")
 
 
+def test_offscreen_child_not_rendered():
+    """Test that children entirely outside the canvas are skipped."""
+    print("\n=== Test: Offscreen Child Skipped ===")
+
+    width, height = 64, 32
+    scene = Scene(width=width, height=height)
+
+    offscreen = ColorComponent(10, 10, (255, 0, 0))
+    scene.add_child('offscreen', offscreen, position=(-10, 5))
+
+    buffer = scene.render(0.0)
+
+    assert not hasattr(offscreen, '_render_cache'), "Offscreen child should not render"
+    assert buffer.get_pixel(0, 5) == (0, 0, 0, 0), "Canvas should stay empty"
+
+    # Moving one pixel onto the canvas makes it visible again
+    scene.children['offscreen'].state['x'] = -9
+    buffer = scene.render(0.0)
+    assert buffer.get_pixel(0, 5) == (255, 0, 0, 255), "Partially visible child should render"
+
+    print("✓ Offscreen children skipped, partially visible children rendered")
+
+
+def test_offscreen_nested_scene_still_renders():
+    """Test that an offscreen nested Scene (not skippable) keeps rendering."""
+    print("\n=== Test: Offscreen Nested Scene Renders ===")
+
+    scene = Scene(width=64, height=32)
+
+    nested = Scene(width=16, height=16)
+    nested.add_child('color', ColorComponent(16, 16, (0, 255, 0)), position=(0, 0))
+    scene.add_child('nested', nested, position=(-16, 0))
+
+    buffer = scene.render(0.0)
+
+    assert not nested.render_offscreen_skippable
+    assert hasattr(nested, '_render_cache'), "Offscreen nested scene should still render"
+    assert buffer.get_pixel(0, 0) == (0, 0, 0, 0), "Offscreen nested scene is not composited"
+
+    print("✓ Offscreen nested scene rendered but not composited")
+
+
+def test_single_fullscreen_child_fast_path():
+    """Test that a lone opaque full-canvas child's buffer is returned as-is."""
+    print("\n=== Test: Single Child Fast Path ===")
+
+    width, height = 64, 32
+    scene = Scene(width=width, height=height)
+
+    background = ColorComponent(width, height, (0, 0, 255))
+    scene.add_child('background', background, position=(0, 0))
+
+    buffer = scene.render(0.0)
+    assert buffer is background.render(0.0), "Scene should reuse the child's buffer"
+
+    # Offset child must be composited normally
+    scene.children['background'].state['x'] = 1
+    buffer = scene.render(0.0)
+    assert buffer is not background.render(0.0), "Offset child should be composited"
+    assert buffer.get_pixel(0, 0) == (0, 0, 0, 0), "Uncovered column should be transparent"
+
+    print("✓ Single full-canvas child skips composition")
+
+
+def test_single_transparent_child_rendered_once():
+    """Test that a lone full-canvas child with transparency is rendered once per frame."""
+    print("\n=== Test: Single Transparent Child ===")
+
+    width, height = 16, 8
+    scene = Scene(width=width, height=height)
+
+    overlay = ColorComponent(width, height, (255, 0, 0, 128))
+    scene.add_child('overlay', overlay, position=(0, 0))
+
+    calls = []
+    render = overlay.render
+    overlay.render = lambda time: calls.append(time) or render(time)
+
+    buffer = scene.render(0.0)
+    assert len(calls) == 1, "Child should be rendered once, not again for compositing"
+    assert buffer is not render(0.0), "Non-opaque child must be composited"
+    assert buffer.get_pixel(0, 0)[0] > 0, "Child pixels should be composited"
+
+    print("✓ Non-opaque single child reuses its rendered buffer")
+
+
 if __name__ == "__main__":
     test_component_positioning()
     test_z_index_layering()
+    test_z_index_change()
     test_add_remove_component()
     test_scene_canvas_size()
     test_multiple_components()
+    test_offscreen_child_not_rendered()
+    test_offscreen_nested_scene_still_renders()
+    test_single_fullscreen_child_fast_path()
+    test_single_transparent_child_rendered_once()
 
     print("\n" + "="*50)
     print("SCENE CORE TESTS PASSED")
@@ -11,6 +11,7 @@ Usage:
 import sys
 import time
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -19,59 +20,73 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from matrix_scene_composer.text_component import (
     TextComponent
 )
-from matrix_scene_composer.font_library import BITMAP_FONT_4PX, BITMAP_FONT_5PX
-from matrix_scene_composer.bitmap_fonts_8px import BITMAP_FONT_8PX
-from matrix_scene_composer.bitmap_fonts_10px import BITMAP_FONT_10PX
+
+from _render_utils import CLEAR_SCREEN, visualize_buffer
+
+
+def enable_ansi_escapes():
+    """Let the Windows console interpret ANSI escapes (no-op elsewhere)."""
+    if os.name == 'nt':
+        # An empty command makes cmd switch the console into VT mode
+        os.system('')
+
+
+def write_frame(text):
+    """
+    Write a whole frame straight to stdout's file descriptor.
+
+    Encodes once and issues os.write calls directly, bypassing the text layer's
+    buffering. Falls back to sys.stdout when it has no descriptor (e.g. when
+    output is captured).
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+
+    # Anything print() already buffered must go out first
+    sys.stdout.flush()
+    view = memoryview(text.encode(sys.stdout.encoding or 'utf-8', 'replace'))
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
 
 
 def clear_screen():
     """Clear terminal screen."""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    write_frame(CLEAR_SCREEN)
 
 
-def visualize_buffer(buffer, scale=1):
+@lru_cache(maxsize=512)
+def render_character(font_size, char, fgcolor=(255, 255, 255), bgcolor=None, padding=2):
     """
-    Visualize a RenderBuffer as ASCII art in the terminal.
+    Render a single character, memoized so repeat passes skip the render.
 
-    Args:
-        buffer: RenderBuffer instance
-        scale: Integer scaling factor (1 = normal, 2 = 2x size, etc.)
+    The returned RenderBuffer is shared between calls and must not be modified.
     """
-    lines = []
-    for y in range(buffer.height):
-        line = ''
-        for x in range(buffer.width):
-            r, g, b, a = buffer.get_pixel(x, y)
-            # Simple thresholding: if any color component > 128, show as filled
-            if r > 128 or g > 128 or b > 128:
-                char = '█'
-            else:
-                char = ' '
-
-            # Apply horizontal scaling
-            line += char * scale
+    component = TextComponent(text=char, fgcolor=fgcolor, bgcolor=bgcolor, padding=padding)
+    # Render at time=0 (static text doesn't change with time)
+    return component.render(time=0.0)
 
-        # Apply vertical scaling by repeating lines
-        for _ in range(scale):
-            lines.append(line)
 
-    return '\n'.join(lines)
+# Human-readable names for special characters
+CHARACTER_NAMES = {
+    ' ': 'SPACE',
+    '!': 'EXCLAMATION',
+    '.': 'PERIOD',
+    ':': 'COLON',
+    '-': 'HYPHEN/MINUS',
+    '>': 'GREATER THAN',
+    '→': 'RIGHT ARROW',
+}
 
 
 def get_character_name(char):
     """Get human-readable name for a character."""
-    names = {
-        ' ': 'SPACE',
-        '!': 'EXCLAMATION',
-        '.': 'PERIOD',
-        ':': 'COLON',
-        '-': 'HYPHEN/MINUS',
-        '>': 'GREATER THAN',
-        '→': 'RIGHT ARROW',
-    }
-
-    if char in names:
-        return names[char]
+    if char in CHARACTER_NAMES:
+        return CHARACTER_NAMES[char]
     elif char.isalpha():
         return f"LETTER {char}"
     elif char.isdigit():
@@ -87,22 +102,18 @@ def animate_font(font_size):
     Args:
         font_size: Integer (4, 5, 8, or 10)
     """
-    # Select appropriate component and font dictionary
+    # Select appropriate font dictionary, importing only the one being reviewed
     if font_size == 4:
-        ComponentClass = TextComponent
-        font_dict = BITMAP_FONT_4PX
+        from matrix_scene_composer.bitmap_fonts import BITMAP_FONT_4PX as font_dict
         scale = 3  # Scale up for better visibility
     elif font_size == 5:
-        ComponentClass = TextComponent
-        font_dict = BITMAP_FONT_5PX
+        from matrix_scene_composer.bitmap_fonts import BITMAP_FONT_5PX as font_dict
         scale = 3
     elif font_size == 8:
-        ComponentClass = TextComponent
-        font_dict = BITMAP_FONT_8PX
+        from matrix_scene_composer.bitmap_fonts_8px import BITMAP_FONT_8PX as font_dict
         scale = 2
     elif font_size == 10:
-        ComponentClass = TextComponent
-        font_dict = BITMAP_FONT_10PX
+        from matrix_scene_composer.bitmap_fonts_10px import BITMAP_FONT_10PX as font_dict
         scale = 2
     else:
         print(f"Error: Unsupported font size {font_size}")
@@ -124,36 +135,33 @@ def animate_font(font_size):
 
     frame_delay = 0.5  # seconds between characters
 
+    # Per-character labels don't change between frames - resolve them up front.
+    # Progress bars are slices of one full and one empty bar.
+    count = len(chars)
+    names = [get_character_name(char) for char in chars]
+    char_widths = [font_dict[char].shape[1] for char in chars]
+    full_bar, empty_bar = "█" * count, "░" * count
+
     try:
         for i, char in enumerate(chars):
-            clear_screen()
-
-            # Create component with this character
-            component = ComponentClass(
-                text=char,
-                fgcolor=(255, 255, 255),
-                bgcolor=None,
-                padding=2
-            )
-
-            # Render at time=0 (static text doesn't change with time)
-            buffer = component.render(time=0.0)
-
-            # Display header
-            print(f"Font: {font_size}px | Character {i+1}/{len(chars)}")
-            print("=" * 60)
-            print(f"\n{get_character_name(char)}: '{char}'")
-            print(f"Dimensions: {buffer.width}x{buffer.height} pixels")
-            print(f"Character width: {font_dict[char].shape[1]}px (excluding padding)")
-            print()
-
-            # Display the character (scaled up for visibility)
-            print(visualize_buffer(buffer, scale=scale))
-            print()
-
-            # Progress indicator
-            progress = "█" * (i + 1) + "░" * (len(chars) - i - 1)
-            print(f"\nProgress: [{progress}] {i+1}/{len(chars)}")
+            buffer = render_character(font_size, char)
+            progress = full_bar[: i + 1] + empty_bar[: count - i - 1]
+
+            # Build the whole frame (clear, header, character scaled up for
+            # visibility, progress indicator) and write it at once
+            frame = [
+                CLEAR_SCREEN,
+                f"Font: {font_size}px | Character {i+1}/{count}\n",
+                "=" * 60 + "\n",
+                f"\n{names[i]}: '{char}'\n",
+                f"Dimensions: {buffer.width}x{buffer.height} pixels\n",
+                f"Character width: {char_widths[i]}px (excluding padding)\n",
+                "\n",
+                visualize_buffer(buffer, scale=scale) + "\n",
+                "\n",
+                f"\nProgress: [{progress}] {i+1}/{count}\n",
+            ]
+            write_frame("".join(frame))
 
             time.sleep(frame_delay)
 
@@ -183,6 +191,7 @@ def main():
         print(f"Error: Invalid font size '{sys.argv[1]}' (must be an integer)")
         sys.exit(1)
 
+    enable_ansi_escapes()
     animate_font(font_size)
 
 
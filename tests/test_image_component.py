@@ -4,22 +4,13 @@
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from matrix_scene_composer import Scene, ImageComponent
 
-
-def render_to_terminal(buffer):
-    """Render buffer to terminal with ANSI true colors."""
-    height, width = buffer.height, buffer.width
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = buffer.get_pixel(x, y)
-            # Flatten alpha: fully transparent shows as black
-            if a == 0:
-                r, g, b = 0, 0, 0
-            print(f'\033[38;2;{r};{g};{b}m█\033[0m', end='')
-        print()
+from _render_utils import render_to_terminal
 
 
 def test_image_component():
@@ -41,12 +32,12 @@ def test_image_component():
     # Render and display
     buffer = scene.render(0.0)
     print()
-    render_to_terminal(buffer)
+    render_to_terminal(buffer, flatten_alpha=True)
     print()
 
     # Test caching - render again should hit cache
     buffer2 = scene.render(0.0)
-    assert buffer.data.tobytes() == buffer2.data.tobytes(), "Cached render should be identical"
+    assert np.array_equal(buffer.data, buffer2.data), "Cached render should be identical"
     print("✓ Caching working correctly")
 
     print("\nTest passed!")
@@ -15,21 +15,15 @@ import sys
 import os
 import time as time_module
 
+import numpy as np
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from matrix_scene_composer import (
     Orchestrator, Scene, TableComponent, RainbowFilter, TextComponent
 )
 
-
-def render_to_terminal(buffer):
-    """Render buffer to terminal with ANSI true colors."""
-    height, width = buffer.height, buffer.width
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = buffer.get_pixel(x, y)
-            print(f'\033[38;2;{r};{g};{b}m█\033[0m', end='')
-        print()
+from _render_utils import render_to_terminal
 
 
 def test_rainbow_filter_with_table():
@@ -112,15 +106,8 @@ def test_rainbow_filter_with_table():
 
     print(f"Re-render time: {elapsed*1000:.3f}ms (should be ~0ms due to caching)")
 
-    # Compare buffers pixel by pixel
-    buffers_match = True
-    for y in range(buffer0.height):
-        for x in range(buffer0.width):
-            if buffer0.get_pixel(x, y) != buffer0_cached.get_pixel(x, y):
-                buffers_match = False
-                break
-        if not buffers_match:
-            break
+    # Compare buffers pixel for pixel
+    buffers_match = np.array_equal(buffer0.data, buffer0_cached.data)
 
     print("Buffers match:", buffers_match)
 
@@ -10,15 +10,7 @@ from matrix_scene_composer import (
     Orchestrator, Scene, TableComponent
 )
 
-
-def render_to_terminal(buffer):
-    """Render buffer to terminal with ANSI true colors."""
-    height, width = buffer.height, buffer.width
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = buffer.get_pixel(x, y)
-            print(f'\033[38;2;{r};{g};{b}m█\033[0m', end='')
-        print()
+from _render_utils import render_to_terminal
 
 
 def test_table_component():
@@ -26,6 +18,7 @@ def test_table_component():
 
     print("\n=== Testing TableComponent with TextComponent ===\n")
 
+    # One orchestrator switches between the three table scenes
     width, height = 64, 32
     orch = Orchestrator(width=width, height=height, fps=10)
     scene = Scene(width=width, height=height)
@@ -63,7 +56,6 @@ def test_table_component():
 
     print("\n\n=== Testing TableComponent with TextComponent ===\n")
 
-    orch2 = Orchestrator(width=width, height=height, fps=10)
     scene2 = Scene(width=width, height=height)
 
     # Different data - scoreboard
@@ -91,15 +83,14 @@ def test_table_component():
 
     scene2.add_child('table2', table2, position=(2, 2))
 
-    orch2.add_scene('test2', scene2)
-    orch2.transition_to('test2')
+    orch.add_scene('test2', scene2)
+    orch.transition_to('test2')
 
-    buffer2 = orch2.render_single_frame(0.0)
+    buffer2 = orch.render_single_frame(0.0)
     render_to_terminal(buffer2)
 
     print("\n\n=== Testing TableComponent without borders ===\n")
 
-    orch3 = Orchestrator(width=width, height=height, fps=10)
     scene3 = Scene(width=width, height=height)
 
     # Minimal table
@@ -124,10 +115,10 @@ def test_table_component():
 
     scene3.add_child('table3', table3, position=(2, 2))
 
-    orch3.add_scene('test3', scene3)
-    orch3.transition_to('test3')
+    orch.add_scene('test3', scene3)
+    orch.transition_to('test3')
 
-    buffer3 = orch3.render_single_frame(0.0)
+    buffer3 = orch.render_single_frame(0.0)
     render_to_terminal(buffer3)
 
     print("\n\n=== Summary ===")
@@ -139,5 +130,55 @@ def test_table_component():
     print()
 
 
+def test_table_set_data():
+    """Test set_data() rebuilds the layout and invalidates the render cache."""
+
+    print("\n=== Testing TableComponent.set_data ===\n")
+
+    table = TableComponent(data=[{"item": "A", "qty": "1"}], font_height=4)
+    before = table.render(0.0)
+    old_size = (table.width, table.height)
+
+    table.set_data([
+        {"item": "APPLE", "qty": "12"},
+        {"item": "B", "qty": "345"},
+    ])
+    after = table.render(0.0)
+
+    print(f"Size: {old_size} -> {(table.width, table.height)}")
+    assert (table.width, table.height) != old_size
+    assert (after.width, after.height) == (table.width, table.height)
+    assert after is not before
+
+    # Same data version reuses the cached viewport
+    assert table.render(1.0) is after
+
+    print("✓ set_data() re-renders with new dimensions")
+
+
+def test_table_border_color():
+    """Test reassigning border_color re-renders the borders."""
+
+    print("\n=== Testing TableComponent.border_color ===\n")
+
+    table = TableComponent(
+        data=[{"item": "A", "qty": "1"}], font_height=4, border_color=(64, 64, 64)
+    )
+    before = table.render(0.0)
+    # Vertical border between the two columns
+    border_x = table.col_widths[0]
+    assert tuple(before.data[0, border_x, :3]) == (64, 64, 64)
+
+    table.border_color = (255, 0, 0)
+    after = table.render(0.0)
+
+    assert after is not before
+    assert tuple(after.data[0, border_x, :3]) == (255, 0, 0)
+
+    print("✓ border_color reassignment re-renders the borders")
+
+
 if __name__ == "__main__":
     test_table_component()
+    test_table_set_data()
+    test_table_border_color()
@@ -10,21 +10,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from matrix_scene_composer import Orchestrator, Scene
 from test_components import TriangleComponent, AnimatedSquareComponent
+from _render_utils import render_to_terminal as render_frame
 
 
 def render_to_terminal(buffer):
-    """Render numpy RGB array to terminal with true colors."""
-    # Clear screen and move cursor to top-left
-    print("\033[2J\033[H", end='')
-
-    height, width, _ = buffer.data.shape
-
-    for y in range(height):
-        for x in range(width):
-            r, g, b = buffer.data[y, x]
-            # Use colored block character
-            print(f'\033[38;2;{r};{g};{b}m█\033[0m', end='')
-        print()  # Newline after each row
+    """Display callback: redraw the frame in place with true colors."""
+    render_frame(buffer, clear=True)
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
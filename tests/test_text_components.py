@@ -9,25 +9,34 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from matrix_scene_composer import Orchestrator, Scene, TextComponent
 
+from _render_utils import render_to_terminal
 
-def render_to_terminal(buffer):
-    """Render buffer to terminal with ANSI true colors."""
-    height, width = buffer.height, buffer.width
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = buffer.get_pixel(x, y)
-            print(f'\033[38;2;{r};{g};{b}m█\033[0m', end='')
-        print()
 
+def create_stages(width=64, height=32):
+    """Create the two active Orchestrator/Scene pairs test_specific_size renders into."""
+    stages = []
+    for scene_id in ('test', 'test2'):
+        orch = Orchestrator(width=width, height=height, fps=10)
+        scene = Scene(width=width, height=height)
+        orch.add_scene(scene_id, scene)
+        orch.transition_to(scene_id)
+        stages.append((orch, scene))
+    return stages
 
-def test_specific_size(font_height):
-    """Test a specific font height."""
+
+def test_specific_size(font_height, stages=None):
+    """
+    Test a specific font height.
+
+    Pass stages from create_stages() to reuse them across calls; children are
+    replaced under the same ids each time.
+    """
 
     print(f"\n=== Testing TextComponent(font_height={font_height}) ===\n")
 
-    width, height = 64, 32
-    orch = Orchestrator(width=width, height=height, fps=10)
-    scene = Scene(width=width, height=height)
+    if stages is None:
+        stages = create_stages()
+    (orch, scene), (orch2, scene2) = stages
 
     # Test basic text
     text1 = TextComponent(text="HELLO WORLD", font_height=font_height, fgcolor=(255, 0, 0))
@@ -45,18 +54,12 @@ def test_specific_size(font_height):
     print(f"TextComponent(font_height={font_height}) '0123456789' dimensions: {text3.width}x{text3.height}")
     scene.add_child('text3', text3, position=(2, y_pos))
 
-    orch.add_scene('test', scene)
-    orch.transition_to('test')
-
     buffer = orch.render_single_frame(0.0)
     print()
     render_to_terminal(buffer)
 
     print(f"\n\n=== Testing bgcolor and padding (font_height={font_height}) ===\n")
 
-    orch2 = Orchestrator(width=width, height=height, fps=10)
-    scene2 = Scene(width=width, height=height)
-
     # Test with background colors and padding
     text4 = TextComponent(text="BG COLOR", font_height=font_height, fgcolor=(255, 255, 0), bgcolor=(0, 0, 128), padding=2)
     print(f"TextComponent(font_height={font_height}) with bgcolor and padding=2: {text4.width}x{text4.height}")
@@ -66,9 +69,6 @@ def test_specific_size(font_height):
     print(f"TextComponent(font_height={font_height}) with bgcolor and padding=3: {text5.width}x{text5.height}")
     scene2.add_child('text5', text5, position=(2, 2 + font_height + 6))
 
-    orch2.add_scene('test2', scene2)
-    orch2.transition_to('test2')
-
     buffer2 = orch2.render_single_frame(0.0)
     print()
     render_to_terminal(buffer2)
@@ -82,11 +82,29 @@ def test_specific_size(font_height):
 
 def test_all_sizes():
     """Test all available font heights (4-16px)."""
+    stages = create_stages()
     for font_height in range(4, 17):
-        test_specific_size(font_height)
+        test_specific_size(font_height, stages)
         print("\n" + "="*60 + "\n")
 
 
+def test_padding_change_rerenders():
+    """Reassigning padding or text after a render resizes and re-renders."""
+    comp = TextComponent("HI", font_height=5, bgcolor=(0, 0, 255))
+    before = comp.render(0.0)
+
+    comp.padding = 2
+    after = comp.render(0.0)
+    assert after is not before
+    assert (after.width, after.height) == (before.width + 4, before.height + 4)
+    assert (comp.width, comp.height) == (after.width, after.height)
+
+    comp.text = "hello"
+    assert comp.text == "HELLO"
+    assert comp.render(0.0).width > after.width
+    print("✓ padding and text changes invalidate the cached render")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Test TextComponent for LED matrix')
     parser.add_argument('font_height', type=int, nargs='?', default=None,